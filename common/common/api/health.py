@@ -6,9 +6,9 @@
     Healthcheck endpoint.
 """
 
-from datetime import datetime
+import asyncio
+from time import monotonic, time
 
-from dateutil import tz
 from fastapi import status
 from fastapi.responses import Response
 from fastapi.routing import APIRouter
@@ -17,6 +17,10 @@ from pydantic import BaseModel
 
 router = APIRouter()
 
+# Checker results are reused for a short time to absorb simultaneous probes
+HEALTH_CACHE_TTL = 1.0
+_health_cache: tuple[float, list["HealthService"]] | None = None
+
 
 class HealthService(BaseModel):
     checker: str
@@ -36,12 +40,8 @@ class Health(BaseModel):
     status_code=status.HTTP_200_OK,
     summary="Healthcheck endpoint",
 )
-def get_health(response: Response) -> Health:
-    results = [
-        cpu_checker(),
-        disk_checker(),
-        memory_checker(),
-    ]
+async def get_health(response: Response) -> Health:
+    results = await run_checkers()
 
     if all(r.passed for r in results):
         r_status = "success"
@@ -52,10 +52,29 @@ def get_health(response: Response) -> Health:
     return Health(
         results=results,
         status=r_status,
-        timestamp=datetime.now(tz=tz.UTC).timestamp(),
+        timestamp=time(),
     )
 
 
+async def run_checkers() -> list[HealthService]:
+    """Run all health checkers concurrently in worker threads (results are cached for HEALTH_CACHE_TTL)."""
+
+    global _health_cache
+
+    now = monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1]
+
+    results = list(await asyncio.gather(
+        asyncio.to_thread(cpu_checker),
+        asyncio.to_thread(disk_checker),
+        asyncio.to_thread(memory_checker),
+    ))
+
+    _health_cache = (now, results)
+    return results
+
+
 def cpu_checker() -> HealthService:
     return HealthService(
         checker=cpu_checker.__name__,
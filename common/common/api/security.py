@@ -6,6 +6,7 @@
     API security utilities.
 """
 
+from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
 
@@ -14,7 +15,11 @@ from common.api.security_jwt import header as header_jwt, verify_jwt
 
 
 async def verify_apikey_or_jwt(key: str | None = Depends(header_apikey), token: str | None = Depends(header_jwt)):
-    try:
+    # dispatch on the provided credentials to avoid raising on the JWT-only path
+    if key is not None:
         return await verify_apikey(key=key)
-    except HTTPException:
+
+    if token is not None:
         return await verify_jwt(token=token)
+
+    raise HTTPException(status.HTTP_401_UNAUTHORIZED, "No credentials provided")
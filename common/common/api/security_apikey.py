@@ -6,13 +6,16 @@
     API security utilities using API key.
 """
 
+import hmac
+
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
 from fastapi.security import APIKeyHeader
 from pydantic import SecretStr
 
-_API_KEY: SecretStr | None = None
+# Plaintext key kept private to this module (never log it)
+_API_KEY_BYTES: bytes | None = None
 
 header = APIKeyHeader(name="X-Api-Key", scheme_name="API Key", auto_error=False)
 header_old = APIKeyHeader(name="Authorization", scheme_name="API Key", auto_error=False)
@@ -22,7 +25,7 @@ async def verify_apikey(key: str | None = Depends(header)):
     if key is None:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "API key missing")
 
-    if key == _get_api_key():
+    if _check_api_key(key):
         return True
 
     raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Incorrect API key")
@@ -34,18 +37,23 @@ async def verify_apikey_old(key: str | None = Depends(header_old)):
     if key is None:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "API key missing")
 
-    if key == _get_api_key():
+    if _check_api_key(key):
         return True
 
     raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Incorrect API key")
 
 
-def _get_api_key() -> str:
-    if _API_KEY is None:
+def _get_api_key() -> bytes:
+    if _API_KEY_BYTES is None:
         raise RuntimeError("API key not initialized")
-    return _API_KEY.get_secret_value()
+    return _API_KEY_BYTES
+
+
+def _check_api_key(key: str) -> bool:
+    # constant-time comparison (header values are not guaranteed to be ASCII, therefore compare bytes)
+    return hmac.compare_digest(key.encode(), _get_api_key())
 
 
 def set_api_key(key: SecretStr):
-    global _API_KEY
-    _API_KEY = key
+    global _API_KEY_BYTES
+    _API_KEY_BYTES = key.get_secret_value().encode()
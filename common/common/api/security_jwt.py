@@ -6,18 +6,58 @@
     API security utilities using JWT.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import time
+
 import httpx
 import jwt
+from cachetools import TLRUCache
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
 from fastapi.security import APIKeyHeader
+from jwt.algorithms import RSAAlgorithm
 
-from common.config import CONFIG
+from common.config import CONFIG, URLS
 
-KEYCLOAK_URL = str(CONFIG.KEYCLOAK_URL).rstrip("/") if CONFIG.KEYCLOAK_URL else None
+KEYCLOAK_URL = URLS.KEYCLOAK
+KEYCLOAK_REALM_URL = f"{KEYCLOAK_URL}/realms/{CONFIG.KEYCLOAK_REALM}" if KEYCLOAK_URL else None
 header = APIKeyHeader(name="Authorization", scheme_name="JWT", auto_error=False)
 
+# KeyCloak realm signing key changes rarely, re-fetch it once an hour
+PUBLIC_KEY_TTL = 3600
+
+# Shared keep-alive client (HTTP/2 is used only if the optional h2 package is installed)
+_http_client = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    timeout=httpx.Timeout(5.0, connect=2.0),
+)
+_public_key: tuple[RSAPublicKey, float] | None = None
+_public_key_lock = asyncio.Lock()
+
+# Invalid tokens are cached only shortly to avoid repeated verification of replayed bad tokens
+JWT_CACHE_TTL_INVALID = 5
+
+
+def _jwt_cache_ttu(_key: bytes, value: dict | tuple[int, str], now: float) -> float:
+    """Get expiration time of a cached JWT verification result."""
+
+    if isinstance(value, tuple):
+        return now + JWT_CACHE_TTL_INVALID
+
+    expires = now + CONFIG.KEYCLOAK_JWT_CACHE_TTL
+    if isinstance(exp := value.get("exp"), (int, float)):
+        expires = min(expires, exp)
+    return expires
+
+
+# Verification results keyed by token hash (accessed from the event loop only, no locking required)
+_jwt_cache = TLRUCache(maxsize=CONFIG.KEYCLOAK_JWT_CACHE_SIZE, ttu=_jwt_cache_ttu, timer=time.time)
+
 
 async def verify_jwt(token: str | None = Depends(header)):
     if KEYCLOAK_URL is None:
@@ -26,37 +66,72 @@ async def verify_jwt(token: str | None = Depends(header)):
     if token is None:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Auth token missing")
 
-    if not token.startswith("Bearer "):
+    if token[:7] != "Bearer ":
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid auth token")
 
+    raw_token = token[7:]
+    token_hash = hashlib.sha256(raw_token.encode()).digest()
+
+    if (cached := _jwt_cache.get(token_hash)) is not None:
+        if isinstance(cached, tuple):
+            raise HTTPException(*cached)
+        return cached
+
     try:
-        return jwt.decode(
-            jwt=token.split(" ", 1)[1],
+        payload = jwt.decode(
+            jwt=raw_token,
             key=await get_public_key(),
             algorithms=["RS256"],
             audience="account",
         )
     except jwt.ExpiredSignatureError:
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Auth token has expired")
+        error = (status.HTTP_401_UNAUTHORIZED, "Auth token has expired")
     except jwt.InvalidTokenError:
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid auth token")
+        error = (status.HTTP_401_UNAUTHORIZED, "Invalid auth token")
     except Exception as e:
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"Failed to decode auth token: {e}")
+    else:
+        _jwt_cache[token_hash] = payload
+        return payload
+
+    _jwt_cache[token_hash] = error
+    raise HTTPException(*error)
+
+
+async def close_http_client():
+    """Close the shared HTTP client (call on app shutdown)."""
+    await _http_client.aclose()
+
+
+async def get_public_key() -> RSAPublicKey:
+    """Get the (cached) public key from KeyCloak."""
 
+    global _public_key
 
-async def get_public_key() -> str:
-    """Retrieve and format the public key from KeyCloak."""
+    if _public_key is not None and _public_key[1] > time.monotonic():
+        return _public_key[0]
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{KEYCLOAK_URL}/realms/{CONFIG.KEYCLOAK_REALM}")
-            response.raise_for_status()
-        except httpx.RequestError as e:
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"Request failed: {e}")
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(e.response.status_code, f"Error response: {e.response.text}")
+    # coalesce concurrent cache misses into a single KeyCloak request
+    async with _public_key_lock:
+        if _public_key is None or _public_key[1] <= time.monotonic():
+            _public_key = (await _fetch_public_key(), time.monotonic() + PUBLIC_KEY_TTL)
+
+    return _public_key[0]
+
+
+async def _fetch_public_key() -> RSAPublicKey:
+    """Retrieve and parse the public key from KeyCloak."""
+
+    try:
+        response = await _http_client.get(KEYCLOAK_REALM_URL)
+        response.raise_for_status()
+    except httpx.RequestError as e:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, f"Request failed: {e}")
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(e.response.status_code, f"Error response: {e.response.text}")
 
     if not (public_key := response.json().get("public_key")):
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Public key not found in KeyCloak response")
 
-    return f"-----BEGIN PUBLIC KEY-----\n{public_key}\n-----END PUBLIC KEY-----"
+    pem = f"-----BEGIN PUBLIC KEY-----\n{public_key}\n-----END PUBLIC KEY-----"
+    return RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(pem)
@@ -8,6 +8,7 @@
     Contains default values generally safe to use for public (develop) Kubernetes deployment.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 
 from pydantic import AnyUrl, Field, SecretStr, ValidationInfo, field_validator
@@ -98,6 +99,9 @@ class Config(BaseSettings):
     KRONOS_PORT: int = Field(9625, alias="KRONOS_CONTAINER_PORT")
     KRONOS_VERSION: str = "latest"
 
+    # Size of the worker thread pool running the sync (blocking DB/storage) endpoints (anyio default is 40)
+    KRONOS_THREADPOOL_SIZE: int = 100
+
     MAESTRO_URL: AnyUrl = "http://maestro"
     MAESTRO_API_KEY: SecretStr
     MAESTRO_LOG_FORMAT: LogFormat = LogFormat.plain
@@ -154,6 +158,10 @@ class Config(BaseSettings):
     KEYCLOAK_REALM: str = "alquist"
     KEYCLOAK_CLIENT_ID: str = "alquist-insight-development"
 
+    # Cache for verified JWT claims (TTL in seconds, capped by the token expiration)
+    KEYCLOAK_JWT_CACHE_SIZE: int = 10000
+    KEYCLOAK_JWT_CACHE_TTL: int = 30
+
     MINIO_URL: AnyUrl = "http://minio.minio.svc.cluster.local:9000"
     MINIO_ACCESS_KEY: str = "admin"
     MINIO_SECRET_KEY: SecretStr | None = None
@@ -188,6 +196,9 @@ class Config(BaseSettings):
     # Flag for saving logs from all backend services to ElasticSearch
     ES_LOGGING_ENABLED: bool = True
 
+    # Number of files/URLs processed concurrently by the bulk knowledge base uploads
+    KB_BULK_UPLOAD_CONCURRENCY: int = 4
+
     ###########
     ## OTHER ##
     ###########
@@ -247,6 +258,30 @@ class Config(BaseSettings):
         return storage_type
 
 
+@dataclass(frozen=True)
+class ConfigURLs:
+    """Backend/service URLs normalized once as strings without the trailing slash."""
+
+    KEYCLOAK: str | None
+    KRONOS: str
+    MAESTRO: str
+    RAGNAROK: str
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ConfigURLs":
+        return cls(
+            KEYCLOAK=_url_str(config.KEYCLOAK_URL),
+            KRONOS=_url_str(config.KRONOS_URL),
+            MAESTRO=_url_str(config.MAESTRO_URL),
+            RAGNAROK=_url_str(config.RAGNAROK_URL),
+        )
+
+
+def _url_str(url: AnyUrl | None) -> str | None:
+    return str(url).rstrip("/") if url else None
+
+
 # noinspection PyArgumentList
 CONFIG = Config()
 DF = Defaults()
+URLS = ConfigURLs.from_config(CONFIG)
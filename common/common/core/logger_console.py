@@ -6,8 +6,11 @@
     Console logging utilities.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from common.core import middleware
 
@@ -33,16 +36,25 @@ class HealthCheckFilter(logging.Filter):
     """Health check filter removes the health check call logs."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-
-        if isinstance(record.args, dict):
+        # response logs (middleware/uvicorn.access) use positional args with the path on index 2
+        args = record.args
+        if not (isinstance(args, tuple) and len(args) >= 3):
             return True
+        return args[2] != "/health"
 
-        try:
-            return not (record.args and len(record.args) >= 3 and record.args[2] == "/health")
-        except Exception as e:
-            logging.error("Failed to parse record args: %s", e)
 
-        return True
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler deferring the record formatting to the queue listener thread.
+
+    Only the message is resolved eagerly (its args might change later), the rest of the formatting
+    (e.g. JSON serialization) and the I/O are done by the listener handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup(logger_name: str, log_level: str | int = logging.DEBUG, fmt: logging.Formatter | None = None):
@@ -55,12 +67,19 @@ def setup(logger_name: str, log_level: str | int = logging.DEBUG, fmt: logging.F
 
     logger_ = logging.getLogger(logger_name)
 
-    # set up logging handler
+    # set up logging handler (records are formatted and written by a background listener thread)
     handler = logging.StreamHandler(sys.stdout)
-    handler.name = HANDLER_NAME
     handler.setFormatter(fmt or logging.Formatter(DEFAULT_LOG_FORMAT))
     handler.setLevel(log_level)
-    logger_.addHandler(handler)
+
+    queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+    queue_handler.name = HANDLER_NAME
+    queue_handler.setLevel(log_level)
+    logger_.addHandler(queue_handler)
+
+    listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     # set up filters
     logger_.addFilter(ContextFilter())
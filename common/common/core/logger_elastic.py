@@ -9,12 +9,16 @@
     ToDo: Use a proper ES logging framework (e.g. Logstash).
 """
 
-import json
+import atexit
 import logging
+import queue
+import threading
+import time
 
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, helpers
 
 from common.core.logger_fmt import JSONFormatter
+from common.utils import fast_json
 
 DEFAULT_INDEX_SETTINGS = {
     "mappings": {
@@ -76,27 +80,100 @@ DEFAULT_INDEX_SETTINGS = {
 }
 
 
+class _LogShipper:
+    """
+    Background thread shipping the logs to ES in bulk requests.
+
+    The logs are buffered in a bounded queue (dropped when full) and sent after collecting
+    `batch_size` logs or after `flush_interval` seconds, whichever comes first.
+    """
+
+    _STOP = object()
+
+    def __init__(
+            self,
+            es_client: Elasticsearch,
+            batch_size: int = 500,
+            flush_interval: float = 1.0,
+            queue_size: int = 10000,
+    ):
+        self.es_client = es_client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="es_log_shipper", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, action: dict):
+        try:
+            self._queue.put_nowait(action)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = 5.0):
+        """Flush the buffered logs and stop the shipper thread."""
+
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            batch, stop = [], False
+            deadline = time.monotonic() + self.flush_interval
+
+            item = self._queue.get()
+            while True:
+                if item is self._STOP:
+                    stop = True
+                    break
+
+                batch.append(item)
+                if len(batch) >= self.batch_size or (timeout := deadline - time.monotonic()) <= 0:
+                    break
+
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+            self._send(batch)
+            if stop:
+                return
+
+    def _send(self, batch: list[dict]):
+        if not batch:
+            return
+
+        try:
+            helpers.bulk(self.es_client, batch, raise_on_error=False)
+        except Exception as e:
+            logging.error("Failed to log to ES: %s", e)
+
+
 class JSONFormatterElastic(JSONFormatter):
 
     def __init__(self, /, es_client: Elasticsearch | None = None, es_index: str = "logs", **kwargs):
         super().__init__(**kwargs)
         self.es_client = es_client
         self.es_index = es_index
+        self.shipper = None
 
         if self.es_client is not None:
             if not self.es_client.indices.exists(index=self.es_index):
                 self.es_client.indices.create(index=self.es_index, body=DEFAULT_INDEX_SETTINGS)
+            self.shipper = _LogShipper(self.es_client)
 
     def format(self, record: logging.LogRecord) -> str:
         d_log = self.prepare_log(record)
         self.log_es(d_log)
-        return json.dumps(d_log)
+        return fast_json.dumps(d_log).decode("utf-8")
 
     def log_es(self, d_log: dict):
-        if self.es_client is None:
-            return
-
-        try:
-            self.es_client.index(index=self.es_index, body=d_log)
-        except Exception as e:
-            logging.error("Failed to log to ES: %s", e)
+        if self.shipper is not None:
+            self.shipper.put({"_index": self.es_index, "_source": d_log})
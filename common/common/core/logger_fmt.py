@@ -6,20 +6,20 @@
     Logging formatters.
 """
 
-import json
 import logging
 import socket
+import time
 import traceback
-from datetime import datetime
-
-from dateutil import tz
 
 from common.core.middleware import X_CORRELATION_ID, X_REQUEST_ID, X_RESPONSE_TIME
+from common.utils import fast_json
 
 # get attributes of LogRecord
 # noinspection PyTypeChecker
-log_record_attrs = [attr for attr in dir(logging.LogRecord("", 0, "", 0, "", "", "")) if not attr.startswith("__")]
-log_record_attrs.extend(["message", "asctime"])
+log_record_attrs = frozenset(
+    [attr for attr in dir(logging.LogRecord("", 0, "", 0, "", "", "")) if not attr.startswith("__")]
+    + ["message", "asctime"]
+)
 attr_names = {X_CORRELATION_ID: "correlation_id", X_REQUEST_ID: "request_id", X_RESPONSE_TIME: "response_time"}
 
 
@@ -37,19 +37,38 @@ class JSONFormatter(logging.Formatter):
         self.scope_attributes = scope_attributes
         self.component_log = component_log
 
+        # static log fields (invariant for the formatter lifetime)
+        self._base_log = {"@version": "1", "host": self.host}
+        if component_log:
+            self._base_log.update(component_log)
+
+        # pre-serialized static fields ('{...,' without the closing brace) to be spliced with the record fields
+        self._base_log_prefix = fast_json.dumps(self._base_log)[:-1] + b","
+
+        self._ts_cache: tuple[int, str] = (-1, "")
+
+    def format_timestamp(self, created: float) -> str:
+        """Format POSIX timestamp as UTC ISO 8601 string (the formatted seconds part is cached)."""
+
+        sec = int(created)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cache = (sec, prefix)
+
+        return f"{prefix}.{int((created - sec) * 1_000_000):06d}+00:00"
+
     @staticmethod
     def add_extra_fields(record: logging.LogRecord) -> dict:
         """Add fields to application log."""
 
-        # if the field is not in the LogRecord class then add it
-        rec = {k: v for k, v in record.__dict__.items() if k not in log_record_attrs}
+        # if the field is not in the LogRecord class then add it (most records have no extra fields)
+        d_record = record.__dict__
+        if not (extra_keys := d_record.keys() - log_record_attrs):
+            return {}
 
         # rename some attributes defined in attr_names
-        for old, new in attr_names.items():
-            if old in rec:
-                rec[new] = rec.pop(old)
-
-        return rec
+        return {attr_names.get(k, k): d_record[k] for k in extra_keys}
 
     @staticmethod
     def add_exc_info(record: logging.LogRecord) -> dict:
@@ -58,8 +77,12 @@ class JSONFormatter(logging.Formatter):
         if not record.exc_info:
             return {}
 
+        # format the traceback only once per record (stdlib formatters reuse the cached exc_text as well)
+        if not record.exc_text:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip("\n")
+
         return {
-            "exception": " ".join(traceback.format_exception(*record.exc_info)),
+            "exception": record.exc_text,
             "lineno": record.lineno,
             "process": record.process,
             "thread_name": record.threadName,
@@ -128,12 +151,15 @@ class JSONFormatter(logging.Formatter):
         d_log.pop("scope", None)
 
     def prepare_log(self, record: logging.LogRecord) -> dict:
+        d_log = self._base_log.copy()
+        d_log.update(self.prepare_record_log(record))
+        return d_log
+
+    def prepare_record_log(self, record: logging.LogRecord) -> dict:
+        """Prepare the record-specific part of the log (without the static fields)."""
 
-        # create log dict
         d_log = {
-            "@timestamp": datetime.fromtimestamp(record.created, tz=tz.UTC).isoformat(),
-            "@version": "1",
-            "host": self.host,
+            "@timestamp": self.format_timestamp(record.created),
             "message": record.getMessage(),
             "level": record.levelname,
             "logger_name": record.name,
@@ -151,26 +177,34 @@ class JSONFormatter(logging.Formatter):
             d_log["module"] = record.module_override
             del record.module_override
 
-        # add component-specific attributes
-        if self.component_log:
-            d_log.update(self.component_log)
-
         # update fields based on log type
-        if "uvicorn.access" in record.name or (getattr(record, "log_type", "")):
+        name = record.name
+        if record.__dict__.get("log_type") or name.startswith("uvicorn.access"):
             self.update_response_log(d_log, record)
-        elif "urllib3" in record.name:
+        elif name.startswith("urllib3"):
             self.update_request_log(d_log, record)
         else:
             self.update_application_log(d_log, record)
 
         # add debug info for exceptions
-        d_log.update(self.add_exc_info(record))
+        if record.exc_info:
+            d_log.update(self.add_exc_info(record))
 
         return d_log
 
+    def serialize(self, record: logging.LogRecord) -> bytes:
+        """Serialize the log into JSON bytes, splicing the pre-serialized static fields with the record fields."""
+
+        d_log = self.prepare_record_log(record)
+
+        # fall back to full serialization if the record overrides any of the static fields
+        if d_log.keys() & self._base_log.keys():
+            return fast_json.dumps({**self._base_log, **d_log})
+
+        return self._base_log_prefix + fast_json.dumps(d_log)[1:]
+
     def format(self, record: logging.LogRecord) -> str:
-        d_log = self.prepare_log(record)
-        return json.dumps(d_log)
+        return self.serialize(record).decode("utf-8")
 
 
 class JSONFormatterLogstash(JSONFormatter):
@@ -181,5 +215,4 @@ class JSONFormatterLogstash(JSONFormatter):
     """
 
     def format(self, record: logging.LogRecord) -> bytes:
-        d_log = self.prepare_log(record)
-        return bytes(json.dumps(d_log), "utf-8")
+        return self.serialize(record)
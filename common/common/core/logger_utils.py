@@ -28,16 +28,19 @@ def log_elapsed_time(_func=None, *, level: int = logging.DEBUG, msg: str | None
     """
 
     def decorator(fn):
+        message = msg or f"Function: {fn.__name__} in module: {fn.__module__}, elapsed time: {{elapsed_time}}"
+        if "{elapsed_time}" not in message:
+            message = f"{message}, elapsed time: {{elapsed_time}}"
+
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
-            message = msg or f"Function: {fn.__name__} in module: {fn.__module__}, elapsed time: {{elapsed_time}}"
-            if "{elapsed_time}" not in message:
-                message = f"{message}, elapsed time: {{elapsed_time}}"
+            if not logger.isEnabledFor(level):
+                return fn(*args, **kwargs)
 
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             result = fn(*args, **kwargs)
             msg_fmt = {
-                "elapsed_time": int(1000 * (time.perf_counter() - start)),
+                "elapsed_time": (time.perf_counter_ns() - start) // 1_000_000,
                 "func_name_override": fn.__name__,
                 "module_override": fn.__module__,
             }
@@ -6,42 +6,47 @@
     Logging middleware.
 """
 
-import functools
 import logging
+import secrets
 import time
-import uuid
-from contextlib import suppress
-from contextvars import ContextVar, Token
-from typing import Any, Callable, Sequence
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar, Token, copy_context
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
 
 from fastapi import APIRouter
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette._utils import get_route_path
 from starlette.requests import Request
-from starlette.responses import Response
-from starlette.routing import Match
-from starlette.types import ASGIApp, Scope
+from starlette.routing import BaseRoute, Match, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 X_CORRELATION_ID = "X-Correlation-Id"
 X_REQUEST_ID = "X-Request-Id"
 X_RESPONSE_TIME = "X-Response-Time"
 
-_CONTEXT: ContextVar = ContextVar("starlette_context", default=None)
+# pre-encoded (lowercase) header names for the raw ASGI response headers
+_H_CONTENT_LENGTH = b"content-length"
+_H_CORRELATION_ID = X_CORRELATION_ID.lower().encode("latin-1")
+_H_REQUEST_ID = X_REQUEST_ID.lower().encode("latin-1")
+_H_RESPONSE_TIME = X_RESPONSE_TIME.lower().encode("latin-1")
 
+# shared read-only empty context used as the default (never mutated)
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+_CONTEXT: ContextVar[Mapping[str, Any]] = ContextVar("starlette_context", default=_EMPTY_CONTEXT)
 
-def get_context() -> dict:
-    try:
-        return _CONTEXT.get()
-    except LookupError:
-        _CONTEXT.set({})
-        return _CONTEXT.get()
+
+def get_context() -> Mapping[str, Any]:
+    return _CONTEXT.get()
 
 
 def get_context_var(var: str) -> Any:
-    return c.get(var) if (c := get_context()) else None
+    return _CONTEXT.get().get(var)
 
 
 def set_context(v: dict | None) -> Token | None:
-    return _CONTEXT.set(v) if v else None
+    if not v:
+        return None
+    return _CONTEXT.set(v)
 
 
 def reset_context(token: Token) -> None:
@@ -55,36 +60,48 @@ def add_to_context(v: dict) -> Token:
     A new token is created, therefore the response log will not contain the added data.
     """
 
-    if ctx := _CONTEXT.get():
-        v.update(ctx)
-    return _CONTEXT.set(v)
+    # merge into a new dict (the argument is not mutated), existing context values take precedence as before
+    return _CONTEXT.set({**v, **ctx} if (ctx := _CONTEXT.get()) else v)
 
 
 def wrap_with_context(func):
     """Decorator that is passing context into individual threads, e.g. for use with the concurrent futures."""
 
-    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        _t = set_context(kwargs.pop("context", None))
-        result = func(*args, **kwargs)
-        reset_context(_t)
-        return result
+        # fast path without context
+        if not (ctx := kwargs.pop("context", None)):
+            return func(*args, **kwargs)
 
+        # the context change is scoped to the run call (no token management needed)
+        return copy_context().run(_run_with_context, ctx, func, args, kwargs)
+
+    # only the reference to the wrapped function is kept (no metadata copying as with functools.wraps)
+    wrapper.__wrapped__ = func
     return wrapper
 
 
+def _run_with_context(ctx: Mapping[str, Any], func: Callable, args: tuple, kwargs: dict) -> Any:
+    _CONTEXT.set(ctx)
+    return func(*args, **kwargs)
+
+
+def submit_with_context(executor: Executor, fn: Callable, /, *args, **kwargs) -> Future:
+    """Submit the function to the executor, running it within a copy of the current context (all context vars)."""
+    return executor.submit(copy_context().run, fn, *args, **kwargs)
+
+
 def update_headers_with_ctx(headers: dict[str, Any] | None = None) -> dict[str, Any]:
     """Update request headers with context."""
 
     headers = headers.copy() if headers else {}
-    headers[X_CORRELATION_ID] = c.get(X_CORRELATION_ID) if (c := get_context()) else uuid.uuid4().hex
-    headers[X_REQUEST_ID] = uuid.uuid4().hex
+    headers[X_CORRELATION_ID] = _CONTEXT.get().get(X_CORRELATION_ID) or secrets.token_hex(16)
+    headers[X_REQUEST_ID] = secrets.token_hex(16)
     return headers
 
 
-async def extract_header_by_key(key: str, request: Request) -> str | None:
-    """Helper method to extract value of header by key."""
-    return request.headers.get(key) or request.headers.get(key.lower()) or uuid.uuid4().hex
+def extract_header_by_key(key: str, request: Request) -> str:
+    """Helper method to extract value of header by key (headers are case-insensitive)."""
+    return request.headers.get(key) or secrets.token_hex(16)
 
 
 class ParamToContext:
@@ -102,13 +119,15 @@ class ParamToContext:
         self.f = fmt_callable
 
 
-class RequestContextLogMiddleware(BaseHTTPMiddleware):
+class RequestContextLogMiddleware:
     """
     Middleware for handling log context information.
 
     For each request extract x-correlation-id, x-request-id and compute x-response-time.
-    If the correlation id and request id are not present generate uuid.
-    Append this information into response headers and scope (for response logging).
+    If the correlation id and request id are not present generate random hex IDs (same format as uuid4 hex).
+    Append this information into response headers and response log.
+
+    Implemented as a pure ASGI middleware (the response headers are injected into the response start message).
     """
 
     def __init__(
@@ -117,10 +136,9 @@ class RequestContextLogMiddleware(BaseHTTPMiddleware):
             logger: logging.Logger | None = None,
             router: APIRouter | None = None,
             extractors: Sequence[ParamToContext] | None = None,
-            **kwargs,
     ):
 
-        super().__init__(app, **kwargs)
+        self.app = app
         self.logger = logger
         self.router = router
         self.extractors = extractors or ()
@@ -131,88 +149,169 @@ class RequestContextLogMiddleware(BaseHTTPMiddleware):
             if ex.f and not callable(ex.f):
                 raise TypeError("This function is not callable")
 
-    async def get_path_params(self, request: Request) -> dict:
+        # extractors flattened into plain tuples for the per-request extraction
+        self._extractors = tuple((ex.param_name, ex.context_name, ex.f) for ex in self.extractors)
+        self._route_table = self._build_route_table()
+        # path params are matched only if some extractor can use them (query params may contain any name)
+        self._needs_path = bool(self._extractors) and not {ex[0] for ex in self._extractors}.isdisjoint(
+            self._path_param_names()
+        )
+
+    def _build_route_table(self) -> tuple[tuple | BaseRoute, ...]:
+        """
+        Pre-build the route table used for path params extraction.
+
+        Plain routes are stored as (path regex, param convertors, methods) tuples, so they can be matched
+        without the `route.matches` overhead. Other routes (e.g. mounts) are matched using the route itself.
+        """
+
+        if not self.router:
+            return ()
+
+        return tuple(
+            (route.path_regex, route.param_convertors, route.methods) if isinstance(route, Route) else route
+            for route in self.router.routes
+        )
+
+    def _path_param_names(self) -> set[str]:
+        """Get names of path params of all router routes (routes other than plain routes may contain any)."""
+
+        names = set()
+        for entry in self._route_table:
+            if not isinstance(entry, tuple):
+                return {ex[0] for ex in self._extractors}
+            names.update(entry[1])
+        return names
+
+    def get_path_params(self, scope: Scope) -> dict:
+
+        route_path = get_route_path(scope)
+        method = scope["method"]
+
+        for entry in self._route_table:
+            if isinstance(entry, tuple):
+                path_regex, convertors, methods = entry
+                if (m := path_regex.match(route_path)) and (not methods or method in methods):
+                    return {k: convertors[k].convert(v) for k, v in m.groupdict().items()}
+                continue
 
-        if self.router:
-            scope: Scope = request.scope
-            for route in self.router.routes:
-                match, child_scope = route.matches(scope)
-                if match == Match.FULL:
-                    return child_scope.get("path_params", {})
+            match, child_scope = entry.matches(scope)
+            if match == Match.FULL:
+                return child_scope.get("path_params", {})
 
         return {}
 
-    async def extract_params(self, params: Any) -> dict:
+    def extract_params(self, params: Any) -> dict:
         """Using the list of extractors (ParamToContext) get and format extractor_param_name parameters."""
 
         if not params:
             return {}
 
         c = {}
-        for extractor in self.extractors:
-            if not (v := params.get(extractor.param_name)):
+        for param_name, context_name, f in self._extractors:
+            if not (v := params.get(param_name)):
+                continue
+
+            if f is None:
+                c[context_name] = v
                 continue
 
-            if extractor.f:
-                with suppress(Exception):
-                    c[extractor.context_name] = extractor.f(v)
-            else:
-                c[extractor.context_name] = v
+            try:
+                c[context_name] = f(v)
+            except Exception:
+                continue
 
         return c
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
+        headers = request.headers
         values_to_ctx = {
-            X_CORRELATION_ID: await extract_header_by_key(X_CORRELATION_ID, request),
-            X_REQUEST_ID: await extract_header_by_key(X_REQUEST_ID, request),
+            X_CORRELATION_ID: headers.get(X_CORRELATION_ID) or secrets.token_hex(16),
+            X_REQUEST_ID: headers.get(X_REQUEST_ID) or secrets.token_hex(16),
         }
 
-        # put query or path params into context
-        r_params = dict(request.query_params)
-        r_params.update(await self.get_path_params(request))
-        values_to_ctx.update(await self.extract_params(r_params))
+        # put query or path params into context (the query string is parsed only if there is something to extract)
+        if self._extractors:
+            r_params = dict(request.query_params) if scope.get("query_string") else {}
+            if self._needs_path:
+                r_params.update(self.get_path_params(scope))
+            values_to_ctx.update(self.extract_params(r_params))
         token: Token = _CONTEXT.set(values_to_ctx)
 
+        ctx = values_to_ctx
+        response_start: Message | None = None
+        response_time = 0
+        before_ns = time.perf_counter_ns()
+
+        async def send_wrapper(message: Message):
+            nonlocal response_start, response_time
+
+            if message["type"] == "http.response.start":
+                response_start = message
+                response_time = (time.perf_counter_ns() - before_ns) // 1_000_000
+
+                # update response headers
+                headers = message.get("headers")
+                if not isinstance(headers, list):
+                    message["headers"] = headers = list(headers or ())
+
+                for k, v in headers:
+                    if k.lower() == _H_CONTENT_LENGTH:
+                        v = v.decode("latin-1")
+                        ctx["content_length"] = int(v) if v.isdigit() else v
+                        break
+
+                headers.extend((
+                    (_H_CORRELATION_ID, ctx[X_CORRELATION_ID].encode("latin-1")),
+                    (_H_REQUEST_ID, ctx[X_REQUEST_ID].encode("latin-1")),
+                    (_H_RESPONSE_TIME, str(response_time).encode("latin-1")),
+                ))
+
+            await send(message)
+
         try:
-            before_time = time.perf_counter()
-            response: Response = await call_next(request)
-            response_time = int(1000 * (time.perf_counter() - before_time))
-            ctx = _CONTEXT.get()
-
-            # update request scope (for logging)
-            if hasattr(request, "scope") and request.scope and ctx:
-                request.scope.update(ctx)
-                request.scope["request_url"] = str(request.url)
-                request.scope[X_RESPONSE_TIME] = response_time
-
-            # update response headers
-            if hasattr(response, "headers") and response.headers and ctx:
-                response.headers[X_CORRELATION_ID] = ctx.get(X_CORRELATION_ID)
-                response.headers[X_REQUEST_ID] = ctx.get(X_REQUEST_ID)
-                response.headers[X_RESPONSE_TIME] = str(response_time)
-
-                v = response.headers.get("content-length")
-                ctx["content_length"] = int(v) if isinstance(v, str) and v.isdigit() else v
-
-            client = request.scope.get("client")
+            await self.app(scope, receive, send_wrapper)
+
+            if response_start is None or not self.logger.isEnabledFor(logging.INFO):
+                return
+
+            client = scope.get("client")
             if client and len(client) == 2:
                 client = f"{client[0]}:{client[1]}"
 
-            ctx.update({"log_type": "response", "scope": request.scope, "status_code": response.status_code})
+            # log only the scope fields used by the formatter (not the whole ASGI scope with app/router/endpoint)
+            scope_log = {
+                **ctx,
+                "type": scope["type"],
+                "method": scope["method"],
+                "http_version": scope.get("http_version"),
+                "server": scope.get("server"),
+                "client": scope.get("client"),
+                "path": scope["path"],
+                "path_params": scope.get("path_params"),
+                "query_string": scope.get("query_string", b""),
+                "request_url": str(request.url),
+                X_RESPONSE_TIME: response_time,
+            }
+
+            ctx.update({"log_type": "response", "scope": scope_log, "status_code": response_start["status"]})
             self.logger.info(
                 '%s - "%s %s %s/%s" %s',
                 client,
-                request.scope.get("method"),
-                request.scope.get("path"),
-                request.scope.get("type").upper(),
-                request.scope.get("http_version"),
-                response.status_code,
+                scope.get("method"),
+                scope.get("path"),
+                scope.get("type").upper(),
+                scope.get("http_version"),
+                response_start["status"],
                 extra=ctx,
             )
 
         finally:
             # reset context with token
             _CONTEXT.reset(token)
-
-        return response
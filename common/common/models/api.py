@@ -8,9 +8,9 @@
 
 from typing import Any
 
-from pydantic import ValidationInfo, field_validator
+from pydantic import model_validator
 
-from common.models.base import CustomBaseModel
+from common.models.base import CustomBaseModel, FastBaseModel
 from common.models.knowledge_base import KnowledgeBase
 from common.models.project import Project
 from common.models.session import Session
@@ -27,24 +27,25 @@ class DeletedCount(CustomBaseModel):
     deleted_storage_blobs: int = 0
 
 
-class Pagination(CustomBaseModel):
+class Pagination(FastBaseModel):
     page_no: int
     per_page: int
     total: int
+    next_cursor: str | None = None
 
 
-class PaginationBaseModel(CustomBaseModel):
+class PaginationBaseModel(FastBaseModel):
     data: list[Any]
     pagination: Pagination | None
 
-    @field_validator("pagination")
-    @classmethod
-    def empty_pagination(cls, v: Pagination | None, info: ValidationInfo) -> Pagination:
-        if v:
-            return v
+    @model_validator(mode="after")
+    def empty_pagination(self) -> "PaginationBaseModel":
+        if self.pagination is not None:
+            return self
 
-        data_len = len(info.data["data"])
-        return Pagination(page_no=1, per_page=data_len, total=data_len)
+        data_len = len(self.data)
+        self.pagination = Pagination(page_no=1, per_page=data_len, total=data_len)
+        return self
 
 
 class PaginatedKnowledgeBase(PaginationBaseModel):
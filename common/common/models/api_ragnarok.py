@@ -13,7 +13,7 @@ from pydantic import Field
 
 from common.config import DF
 from common.models import elastic as me
-from common.models.base import CustomBaseModel
+from common.models.base import CustomBaseModel, FastBaseModel
 from common.models.project import AISettings
 
 
@@ -49,7 +49,7 @@ class RAGPayload(CustomBaseModel):
     return_matched_chunks: bool = True
 
 
-class RAGHighlightSpan(CustomBaseModel):
+class RAGHighlightSpan(FastBaseModel):
     kb_id: str
     source_file: str
     page: int
@@ -62,12 +62,12 @@ class RAGHighlightSpan(CustomBaseModel):
     chunk_level: str | None = None
 
 
-class RAGHighlightGroup(CustomBaseModel):
+class RAGHighlightGroup(FastBaseModel):
     l0_chunk: RAGHighlightSpan | None
     l1_chunks: list[RAGHighlightSpan]
 
 
-class RAGResponse(CustomBaseModel):
+class RAGResponse(FastBaseModel):
     generated_text: str | None = None
     highlights: list[RAGHighlightGroup] | None = None
     matched_chunks: list[me.KBEntry] | None = None
@@ -3,7 +3,7 @@
     common.models.base
     ~~~~~~~~~~~~~~~~~~
 
-    Custom Pydantic base model.
+    Custom Pydantic base models.
 """
 
 from pydantic import BaseModel, ConfigDict
@@ -17,3 +17,13 @@ class CustomBaseModel(BaseModel):
         validate_by_alias=True,
         validate_by_name=True,
     )
+
+
+class FastBaseModel(CustomBaseModel):
+    """
+    Base model for internal hot-path objects (search hits, RAG responses, pagination).
+
+    Values are validated on construction only, attribute assignments are not re-validated.
+    """
+
+    model_config = ConfigDict(validate_assignment=False)
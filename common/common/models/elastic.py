@@ -11,7 +11,7 @@ from typing import Any
 
 from pydantic import Field
 
-from common.models.base import CustomBaseModel
+from common.models.base import CustomBaseModel, FastBaseModel
 from common.models.enums import SourceType
 from common.models.validation import Language, utc_now
 
@@ -48,13 +48,13 @@ class KBMetadata(DocumentLoaderMetadata):
     created_at: datetime = Field(default_factory=utc_now)
 
 
-class KBSource(CustomBaseModel):
+class KBSource(FastBaseModel):
     metadata: KBMetadata
     text: str
     vector: list[float] | None = None
 
 
-class KBEntry(CustomBaseModel):
+class KBEntry(FastBaseModel):
     id: str = Field(alias="_id")
     index: str = Field(alias="_index")
     score: float = Field(alias="_score")
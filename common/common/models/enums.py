@@ -7,6 +7,7 @@
 """
 
 from enum import Enum, unique
+from types import MappingProxyType
 
 
 #############
@@ -110,15 +111,15 @@ class SourceType(str, Enum):
     XLSX = "xlsx"
 
 
-RESOURCE_TO_MIME = {
+RESOURCE_TO_MIME = MappingProxyType({
     ResourceType.CHATBOT_HTML: "text/html",
     ResourceType.DIALOGUE_FSM: "application/json",
     ResourceType.IMAGE: "application/octet-stream",
     ResourceType.SOURCE_DOCUMENT: None,
     ResourceType.SOURCE_KB: None,
-}
+})
 
-SOURCE_TO_MIME = {
+SOURCE_TO_MIME = MappingProxyType({
     SourceType.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     SourceType.HTML: "text/html",
     SourceType.MD: "text/markdown",
@@ -126,6 +127,9 @@ SOURCE_TO_MIME = {
     SourceType.PPTX: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
     SourceType.TXT: "text/plain",
     SourceType.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-}
+})
 
-MIME_TO_SOURCE = {v: k for k, v in SOURCE_TO_MIME.items()}
+MIME_TO_SOURCE = MappingProxyType({v: k for k, v in SOURCE_TO_MIME.items()})
+
+# plain value lookup (avoids the Enum call machinery on hot paths)
+SOURCE_TYPE_BY_VALUE = MappingProxyType({x.value: x for x in SourceType})
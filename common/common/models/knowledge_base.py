@@ -34,6 +34,7 @@ class KnowledgeBase(CustomBaseModel):
 
     source_file: str | None = None
     source_type: SourceType = SourceType.PDF
+    content_hash: str = ""
 
     enable_highlights: bool = False
 
@@ -6,18 +6,39 @@
     ElasticSearch service utilities.
 """
 
-from cachetools.func import ttl_cache
+from functools import lru_cache
+
 from elastic_transport.client_utils import DEFAULT
 from elasticsearch import Elasticsearch
 
 from common.config import CONFIG, PATH_ES_CERT
 
+_DEFAULT_CLIENT: Elasticsearch | None = None
+
 
-@ttl_cache(ttl=600)
 def get_client(**kwargs) -> Elasticsearch:
+    """
+    Get a shared ElasticSearch client.
+
+    Clients are kept for the lifetime of the process (the client pool handles reconnects by itself),
+    the same kwargs in any order return the same client.
+    """
+
+    global _DEFAULT_CLIENT
+
+    if kwargs:
+        return _get_client_cached(tuple(sorted(kwargs.items())))
+
+    if _DEFAULT_CLIENT is None:
+        _DEFAULT_CLIENT = _get_client_cached(())
+    return _DEFAULT_CLIENT
+
+
+@lru_cache(maxsize=8)
+def _get_client_cached(kwargs: tuple[tuple[str, object], ...]) -> Elasticsearch:
     return Elasticsearch(
         hosts=str(CONFIG.ES_URL),
         basic_auth=(CONFIG.ES_USER, CONFIG.ES_PASSWORD.get_secret_value()),
         ca_certs=PATH_ES_CERT if PATH_ES_CERT.exists() else DEFAULT,
-        **kwargs,
+        **dict(kwargs),
     )
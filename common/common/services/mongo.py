@@ -6,22 +6,36 @@
     MongoDB service utilities.
 """
 
+import atexit
+from functools import lru_cache
 from typing import Any
 
-from cachetools.func import ttl_cache
 from pymongo import MongoClient
+from pymongo.collection import Collection
 
 from common.config import CONFIG
 
 
-@ttl_cache(ttl=600)
 def get_client(conn_str: str | None = None) -> MongoClient:
-    return MongoClient(conn_str or CONFIG.MONGO_CONN_STR.get_secret_value())
+    """Get a shared MongoDB client (kept for the process lifetime, the client pool handles reconnects)."""
+    return _get_client_cached(conn_str or CONFIG.MONGO_CONN_STR.get_secret_value())
+
+
+@lru_cache(maxsize=16)
+def _get_client_cached(conn_str: str) -> MongoClient:
+    client = MongoClient(conn_str)
+    atexit.register(client.close)
+    return client
 
 
 def prepare_projection(fields: set[str] | None) -> dict[str, int] | None:
-    """Prepare MongoDB projection for a set of included fields."""
-    return {field: 1 for field in fields} if fields else None
+    """Prepare MongoDB projection for a set of included fields (shared instance, do not modify)."""
+    return _prepare_projection_cached(frozenset(fields)) if fields else None
+
+
+@lru_cache(maxsize=256)
+def _prepare_projection_cached(fields: frozenset[str]) -> dict[str, int]:
+    return {field: 1 for field in fields}
 
 
 def process_filter(ftr: dict[str, Any] | None) -> dict[str, Any] | None:
@@ -31,7 +45,65 @@ def process_filter(ftr: dict[str, Any] | None) -> dict[str, Any] | None:
         return None
 
     return {
-        k: {"$in": v} if isinstance(v, list) else v
+        k: {"$in": v} if type(v) is list else v
         for k, v in ftr.items()
         if v is not None
     }
+
+
+def find_paginated(
+        coll: Collection,
+        ftr: dict[str, Any] | None,
+        projection: dict[str, int] | None = None,
+        sort_by: str | None = None,
+        page_no: int = 1,
+        per_page: int = 10,
+        cursor: str | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Find documents for one page of results together with the total count.
+
+    The total is derived from the returned page where possible (no pagination, last page),
+    the count query is issued only if there may be more documents than returned.
+
+    With a cursor, keyset pagination is used instead of the page number - documents are ordered by ID descending
+    and only documents with ID lower than the cursor (ID of the last document of the previous page) are returned.
+
+    :param coll: MongoDB collection
+    :param ftr: MongoDB query filter
+    :param projection: MongoDB projection
+    :param sort_by: field name to sort by (for descending order user prefix "-")
+    :param page_no: [pagination] page number
+    :param per_page: [pagination] results per page (use 0 for no pagination)
+    :param cursor: [pagination] keyset pagination cursor (page number and sorting are ignored)
+    :return: list of found documents, total count
+    """
+
+    if cursor:
+        ftr_cursor = {"_id": {"$lt": cursor}}
+        # combined with the filter (which may contain its own _id condition)
+        res = coll.find({"$and": [ftr, ftr_cursor]} if ftr else ftr_cursor, projection).sort([("_id", -1)])
+        if per_page > 0:
+            res = res.limit(per_page)
+        return res.to_list(), coll.count_documents(ftr)
+
+    res = coll.find(ftr, projection)
+
+    if sort_by:
+        sort_field = sort_by.lstrip("-")
+        sort_order = -1 if sort_by.startswith("-") else 1
+        # _id as a tie-breaker for a stable order (not for _id itself, the duplicate key would override the order)
+        res.sort([(sort_field, sort_order)] + ([("_id", 1)] if sort_field != "_id" else []))
+
+    if per_page <= 0:
+        docs = res.to_list()
+        return docs, len(docs)
+
+    skip = per_page * (page_no - 1)
+    docs = res.skip(skip).limit(per_page).to_list()
+
+    # a partial page is the last one (unless it is empty and past the end, the total is unknown then)
+    if len(docs) < per_page and (docs or not skip):
+        return docs, skip + len(docs)
+
+    return docs, coll.count_documents(ftr)
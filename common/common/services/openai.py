@@ -6,9 +6,10 @@
     (Azure) OpenAI service utilities.
 """
 
+import atexit
 import re
+from functools import lru_cache
 
-from cachetools.func import ttl_cache
 from openai import OpenAI
 from openai.lib.azure import AzureOpenAI
 
@@ -16,28 +17,34 @@ from common.config import CONFIG, OpenAIType
 
 AZURE_API_VERSION = "2024-12-01-preview"
 
+_RE_NON_VERSION = re.compile(r"[^0-9.]")
 
-@ttl_cache(ttl=600)
+
+@lru_cache(maxsize=1)
 def get_client() -> AzureOpenAI | OpenAI:
-    """Get (Azure) OpenAI client based on OpenAI type config."""
+    """Get (Azure) OpenAI client based on OpenAI type config (shared for the process lifetime)."""
 
     if CONFIG.OPENAI_TYPE == OpenAIType.AzureOpenAI:
-        return AzureOpenAI(
+        client = AzureOpenAI(
             api_key=CONFIG.OPENAI_KEY.get_secret_value(),
             api_version=AZURE_API_VERSION,
             azure_endpoint=str(CONFIG.OPENAI_ENDPOINT),
         )
+    else:
+        client = OpenAI(api_key=CONFIG.OPENAI_KEY.get_secret_value())
 
-    return OpenAI(api_key=CONFIG.OPENAI_KEY.get_secret_value())
+    atexit.register(client.close)
+    return client
 
 
+@lru_cache(maxsize=64)
 def get_gpt_version(model_name: str) -> float | None:
-    """Get GPT model version from the model name string."""
+    """Get GPT model version from the model name string (memoized, there are only a few model names)."""
 
     if "gpt" not in model_name:
         return None
 
     try:
-        return float(re.sub("[^0-9.]", "", model_name))
+        return float(_RE_NON_VERSION.sub("", model_name))
     except ValueError:
         return None
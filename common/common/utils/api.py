@@ -7,28 +7,20 @@
 """
 
 from base64 import b64encode
-from functools import wraps
+from functools import lru_cache, wraps
+from typing import Any, NoReturn
 
 from fastapi import status
 from fastapi.exceptions import HTTPException
+from fastapi.responses import Response
 from pydantic import ValidationError
 
 from common.core import get_component_logger
-from common.utils import exceptions as exc
+from common.models.api import Pagination
+from common.utils import exceptions as exc, fast_json
 
 logger = get_component_logger()
 
-EXC_TO_STATUS = {
-    exc.DBRecordAlreadyExists: status.HTTP_409_CONFLICT,
-    exc.DBRecordNotFound: status.HTTP_404_NOT_FOUND,
-    exc.InvalidModelProvider: status.HTTP_400_BAD_REQUEST,
-    exc.ResourceNotFound: status.HTTP_404_NOT_FOUND,
-    exc.ResourceNotFoundURL: status.HTTP_404_NOT_FOUND,
-    exc.UnsupportedContentType: status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-}
-
-HANDLED_EXCEPTIONS = tuple(EXC_TO_STATUS.keys())
-
 
 def error_handler(func):
     @wraps(func)
@@ -36,17 +28,8 @@ def error_handler(func):
 
         try:
             return func(*args, **kwargs)
-        except ValidationError as e:
-            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(e))
-        except HTTPException as e:
-            logger.error(e)
-            raise e
-        except HANDLED_EXCEPTIONS as e:
-            logger.error(e)
-            raise HTTPException(EXC_TO_STATUS[type(e)], str(e))
         except Exception as e:
-            logger.exception(msg := f"Unhandled exception occurred: {e}")
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, msg) from e
+            _raise_http_exception(e)
 
     return wrapper
 
@@ -57,21 +40,30 @@ def error_handler_async(func):
 
         try:
             return await func(*args, **kwargs)
-        except ValidationError as e:
-            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(e))
-        except HTTPException as e:
-            logger.error(e)
-            raise e
-        except HANDLED_EXCEPTIONS as e:
-            logger.error(e)
-            raise HTTPException(EXC_TO_STATUS[type(e)], str(e))
         except Exception as e:
-            logger.exception(msg := f"Unhandled exception occurred: {e}")
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, msg) from e
+            _raise_http_exception(e)
 
     return wrapper
 
 
+def _raise_http_exception(e: Exception) -> NoReturn:
+    """Log the exception and raise it translated to HTTPException (shared by the sync/async error handlers)."""
+
+    if isinstance(e, ValidationError):
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(e))
+
+    if isinstance(e, HTTPException):
+        logger.error("%s", e)
+        raise e
+
+    if isinstance(e, exc.CustomException) and e.http_status is not None:
+        logger.error("%s", e)
+        raise HTTPException(e.http_status, str(e))
+
+    logger.exception(msg := f"Unhandled exception occurred: {e}")
+    raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, msg) from e
+
+
 def encode_header_string(v: str) -> str:
     """
     Encode a string to be passed in the headers.
@@ -80,4 +72,51 @@ def encode_header_string(v: str) -> str:
     :return: encoded string
     """
 
-    return b64encode(v.encode("utf-8")).decode()
+    # base64 output is always ASCII
+    return b64encode(v.encode("utf-8")).decode("ascii")
+
+
+@lru_cache(maxsize=256)
+def parse_fields(fields: str) -> frozenset[str] | None:
+    """
+    Parse the CSV of field names used for DB projection (parsed once per distinct value).
+
+    :param fields: field names as CSV
+    :return: set of field names (None if empty)
+    """
+
+    return frozenset(x.strip() for x in fields.split(",")) if fields else None
+
+
+def get_next_cursor(data: list[Any], per_page: int) -> str | None:
+    """
+    Get keyset pagination cursor for the next page (ID of the last item if the page is full).
+
+    :param data: page data (models or dicts)
+    :param per_page: results per page
+    :return: next page cursor (None if there are no more results)
+    """
+
+    if per_page <= 0 or len(data) < per_page:
+        return None
+
+    last = data[-1]
+    return last["_id"] if isinstance(last, dict) else last.id
+
+
+def paginated_json_response(data: list[dict[str, Any]], pagination: Pagination | None) -> Response:
+    """
+    Build a paginated JSON response directly from DB documents (e.g. with projected fields).
+
+    The documents are serialized as they are, without building and dumping the pydantic response models.
+
+    :param data: list of DB documents
+    :param pagination: pagination info (None -> single page with all the data)
+    :return: JSON response
+    """
+
+    if pagination is None:
+        pagination = Pagination(page_no=1, per_page=len(data), total=len(data))
+
+    content = fast_json.dumps({"data": data, "pagination": pagination.model_dump()})
+    return Response(content=content, media_type="application/json")
@@ -7,28 +7,50 @@
 """
 
 from enum import Enum
+from http import HTTPStatus
 from typing import Iterable
 
 
 class CustomException(Exception):
+    """
+    Base project exception, the detail message is formatted only when it is read.
+
+    Exceptions with http_status set are translated to HTTP error responses with that status by the API error handlers.
+    """
+
+    http_status: HTTPStatus | None = None
 
     def __init__(self, detail: str = "Unknown exception occurred"):
-        self.detail = detail
+        self._detail = detail
+
+    @property
+    def detail(self) -> str:
+        return self._detail
 
     def __str__(self):
         return self.detail
 
 
 class DBRecordAlreadyExists(CustomException):
+    http_status = HTTPStatus.CONFLICT
 
     def __init__(self, _id: str):
-        self.detail = f"Data record with ID '{_id}' already exists in the database"
+        self._id = _id
+
+    @property
+    def detail(self) -> str:
+        return f"Data record with ID '{self._id}' already exists in the database"
 
 
 class DBRecordNotFound(CustomException):
+    http_status = HTTPStatus.NOT_FOUND
 
     def __init__(self, _id: str | Iterable[str]):
-        self.detail = f"Data record(s) with ID(s) '{_id}' not found in the database"
+        self._id = _id
+
+    @property
+    def detail(self) -> str:
+        return f"Data record(s) with ID(s) '{self._id}' not found in the database"
 
 
 class DocumentParsingError(CustomException):
@@ -36,21 +58,36 @@ class DocumentParsingError(CustomException):
 
 
 class InvalidModelProvider(CustomException):
+    http_status = HTTPStatus.BAD_REQUEST
 
     def __init__(self, provider: Enum):
-        self.detail = f"Invalid model provider: '{provider.value}'"
+        self.provider = provider
+
+    @property
+    def detail(self) -> str:
+        return f"Invalid model provider: '{self.provider.value}'"
 
 
 class ResourceNotFound(CustomException):
+    http_status = HTTPStatus.NOT_FOUND
 
     def __init__(self, resource_id: str):
-        self.detail = f"Resource '{resource_id}' not found"
+        self.resource_id = resource_id
+
+    @property
+    def detail(self) -> str:
+        return f"Resource '{self.resource_id}' not found"
 
 
 class ResourceNotFoundURL(CustomException):
+    http_status = HTTPStatus.NOT_FOUND
 
     def __init__(self, url: str):
-        self.detail = f"Resource for URL '{url}' not found (HTTP_404)"
+        self.url = url
+
+    @property
+    def detail(self) -> str:
+        return f"Resource for URL '{self.url}' not found (HTTP_404)"
 
 
 class RetrievalError(CustomException):
@@ -58,6 +95,12 @@ class RetrievalError(CustomException):
 
 
 class UnsupportedContentType(CustomException):
+    http_status = HTTPStatus.UNSUPPORTED_MEDIA_TYPE
 
     def __init__(self, url: str, content_type: str):
-        self.detail = f"Unsupported content type '{content_type}' for URL '{url}'"
+        self.url = url
+        self.content_type = content_type
+
+    @property
+    def detail(self) -> str:
+        return f"Unsupported content type '{self.content_type}' for URL '{self.url}'"
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+    common.utils.fast_json
+    ~~~~~~~~~~~~~~~~~~~~~~
+
+    JSON (de)serialization using orjson with a fallback to the standard json library.
+"""
+
+import json
+from datetime import date
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize object to UTF-8 encoded JSON bytes (optionally pretty-printed with 2-space indentation)."""
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=option | orjson.OPT_INDENT_2 if indent else option)
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode("utf-8")
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types supported by orjson natively (fallback json only)."""
+
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON bytes or string."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -6,10 +6,21 @@
     Miscellaneous/uncategorized utility functions used throughout the project.
 """
 
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
 
-def generate_batches(iterable, n: int = 1):
-    for ndx in range(0, ln := len(iterable), n):
-        yield iterable[ndx:min(ndx + n, ln)]
+
+def generate_batches(iterable: Iterable, n: int = 1) -> Iterator:
+    """Split the input into batches of size n (sequences are sliced, other iterables are streamed as lists)."""
+
+    if isinstance(iterable, Sequence):
+        for ndx in range(0, len(iterable), n):
+            yield iterable[ndx:ndx + n]
+        return
+
+    it = iter(iterable)
+    while batch := list(islice(it, n)):
+        yield batch
 
 
 def dict_to_dot_keys(inp: dict, prefix: str = "") -> dict:
@@ -17,10 +28,17 @@ def dict_to_dot_keys(inp: dict, prefix: str = "") -> dict:
 
     out = {}
 
-    for k, v in inp.items():
-        if isinstance(v, dict):
-            out.update(dict_to_dot_keys(v, prefix=f"{prefix}.{k}"))
+    # iterative depth-first traversal (keeps the key order of the recursive version)
+    stack = [(prefix, iter(inp.items()))]
+    while stack:
+        pfx, items = stack[-1]
+        for k, v in items:
+            key = f"{pfx}.{k}" if pfx else f"{k}"
+            if isinstance(v, dict):
+                stack.append((key, iter(v.items())))
+                break
+            out[key] = v
         else:
-            out[f"{prefix}.{k}"] = v
+            stack.pop()
 
-    return {k.lstrip("."): v for k, v in out.items()}
+    return out
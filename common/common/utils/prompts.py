@@ -35,6 +35,10 @@ PROMPT_REWRITE = (
     "Write the query in {language}."
 )
 
+# the rewrite prompt depends only on the language, build it once for each known language
+_PROMPTS_REWRITE = {code: PROMPT_REWRITE.format(language=name) for code, name in LANG_CODE_TO_NAME.items()}
+_PROMPT_REWRITE_DEFAULT = _PROMPTS_REWRITE[DF.LANG]
+
 
 def build_prompt_general(kb_documents: list[str], lang: str = DF.LANG) -> str:
     """
@@ -47,7 +51,7 @@ def build_prompt_general(kb_documents: list[str], lang: str = DF.LANG) -> str:
 
     return PROMPT_GENERAL.format(
         context="\n\n".join(kb_documents),
-        language=LANG_CODE_TO_NAME.get(lang) or LANG_CODE_TO_NAME[DF.LANG],
+        language=_get_language_name(lang),
     )
 
 
@@ -59,7 +63,11 @@ def build_prompt_rewrite(lang: str = DF.LANG) -> str:
     :return: query rewrite LLM prompt
     """
 
-    return PROMPT_REWRITE.format(language=LANG_CODE_TO_NAME.get(lang) or LANG_CODE_TO_NAME[DF.LANG])
+    return _PROMPTS_REWRITE.get(lang, _PROMPT_REWRITE_DEFAULT)
+
+
+def _get_language_name(lang: str) -> str:
+    return LANG_CODE_TO_NAME.get(lang) or LANG_CODE_TO_NAME[DF.LANG]
 
 
 def build_messages(system_prompt: str, query: str, history: list[dict[str, str]]) -> list[dict[str, str]]:
@@ -72,7 +80,8 @@ def build_messages(system_prompt: str, query: str, history: list[dict[str, str]]
     :return: list of messages ready to be sent to LLM
     """
 
-    messages = [{"role": "system", "content": system_prompt}]
-    messages.extend(history)
-    messages.append({"role": "user", "content": query})
-    return messages
+    return [
+        {"role": "system", "content": system_prompt},
+        *history,
+        {"role": "user", "content": query},
+    ]
@@ -9,30 +9,39 @@
 from abc import ABCMeta
 from threading import Lock
 
-LOCK = Lock()
-
 
 class Singleton(type):
     """
     Singleton metaclass definition.
 
     The singleton identity depends on the parameters used in __init__.
-    Uses thread lock via metaclass pattern.
+    Uses per-instance thread locks via metaclass pattern.
     """
 
     _instances = {}
+    _locks = {}
 
     def __call__(cls, *args, **kwargs):
         """(Create and) call the one and only class instance."""
 
-        key = (cls, args, str(kwargs))
+        try:
+            key = (cls, args, frozenset(kwargs.items()))
+            instance = cls._instances.get(key)
+        except TypeError:
+            # unhashable arguments
+            key = (cls, repr(args), repr(kwargs))
+            instance = cls._instances.get(key)
+
+        if instance is not None:
+            return instance
 
-        if key not in cls._instances:
-            with LOCK:
-                if key not in cls._instances:
-                    cls._instances[key] = super(Singleton, cls).__call__(*args, **kwargs)
+        # lock only the (rare) miss path, per key, so expensive instances (models, clients) are created only once
+        # and constructing one singleton does not block (or deadlock) construction of the others
+        with cls._locks.setdefault(key, Lock()):
+            if (instance := cls._instances.get(key)) is None:
+                instance = cls._instances[key] = super(Singleton, cls).__call__(*args, **kwargs)
 
-        return cls._instances[key]
+        return instance
 
 
 class SingletonABC(ABCMeta, Singleton):
@@ -40,7 +49,7 @@ class SingletonABC(ABCMeta, Singleton):
     Singleton metaclass definition for abstract classes.
 
     The singleton identity depends on the parameters used in __init__.
-    Uses thread lock via metaclass pattern.
+    Uses per-instance thread locks via metaclass pattern.
     """
 
     pass
@@ -6,6 +6,9 @@
     Swagger UI utilities.
 """
 
+from collections import defaultdict
+from functools import lru_cache
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
@@ -24,37 +27,30 @@ def setup_descriptions(app: FastAPI):
                 field.field_info.description = params.get(field.name, "")
 
 
+@lru_cache(maxsize=512)
 def _parse_docstring(rst: str | None) -> tuple[str, str, dict[str, str]]:
     """Parse rST docstring."""
 
     if not rst or not rst.strip():
         return "", "", {}
 
-    desc, params, returns = [], [], []
-    add_to, p_name = desc, None
+    desc, returns = [], []
+    params = defaultdict(list)
+    add_to = desc
 
+    # single pass, continuation lines are added to the current section (description, param or return)
     for line in rst.splitlines():
         line = line.strip()
 
-        if line.startswith(prefix := ":param "):
-            add_to = params
-            p_name, p_desc = line[len(prefix):].split(":", 1)
-            line = (p_name.strip(), p_desc.lstrip())
+        if line.startswith(":param "):
+            p_name, line = line[7:].split(":", 1)
+            add_to = params[p_name.strip()]
+            line = line.lstrip()
 
-        elif line.startswith(prefix := ":return:"):
+        elif line.startswith(":return:"):
             add_to = returns
-            line = line[len(prefix):].lstrip()
+            line = line[8:].lstrip()
 
         add_to.append(line)
 
-    d_params = {}
-    for p_name, p_desc in params:
-        if not (v := d_params.get(p_name, [])):
-            d_params[p_name] = v
-        v.append(p_desc)
-
-    desc = "\n".join(desc)
-    returns = "\n".join(returns).title()
-    params = {k: "\n".join(v) for k, v in d_params.items()}
-
-    return desc, returns, params
+    return "\n".join(desc), "\n".join(returns).title(), {k: "\n".join(v) for k, v in params.items()}
@@ -8,19 +8,21 @@
 
 from fastapi import status
 from fastapi.datastructures import UploadFile
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
 from common.core import get_component_logger
 from common.models import api as ma
 from common.models.enums import ResourceType, SourceType
 from common.models.knowledge_base import KnowledgeBase
-from common.utils.api import error_handler
 from kronos.api import knowledge_base as api_kb, resources as api_resources
 
 logger = get_component_logger()
 router = APIRouter()
 
+# The endpoints only delegate to the current implementations that are already wrapped with the error handler
+# (wrapping them again would only add a call layer and log each HTTP error twice).
+
 
 @router.get(
     "/projects/{project_id}/knowledge_base/",
@@ -29,7 +31,6 @@ router = APIRouter()
     summary="List general info for project knowledge bases",
     tags=["knowledge base"],
 )
-@error_handler
 def list_kb(
         project_id: str,
         embedding_model: str | None = None,
@@ -39,7 +40,7 @@ def list_kb(
         sort_by: str = "",
         page_no: int = 1,
         per_page: int = 10,
-) -> ma.PaginatedKnowledgeBase | JSONResponse:
+) -> ma.PaginatedKnowledgeBase | Response:
     """
     List general info for project knowledge bases.
 
@@ -66,7 +67,6 @@ def list_kb(
     summary="Get knowledge base data",
     tags=["knowledge base"],
 )
-@error_handler
 def get_kb(project_id: str, kb_id: str) -> KnowledgeBase:
     """
     Get knowledge base data.
@@ -85,7 +85,6 @@ def get_kb(project_id: str, kb_id: str) -> KnowledgeBase:
     summary="Get the KB source file",
     tags=["knowledge base"],
 )
-@error_handler
 def get_kb_source(project_id: str, kb_id: str, source_type: SourceType | None = None) -> Response:
     """
     Get the KB source file.
@@ -104,7 +103,6 @@ def get_kb_source(project_id: str, kb_id: str, source_type: SourceType | None =
     summary="Upload file as knowledge base",
     tags=["knowledge base"],
 )
-@error_handler
 def upload_file_kb(
         file: UploadFile,
         project_id: str,
@@ -145,7 +143,6 @@ def upload_file_kb(
     summary="Upload files as knowledge base in bulk",
     tags=["knowledge base"],
 )
-@error_handler
 def upload_file_kb_bulk(
         files: list[UploadFile],
         project_id: str,
@@ -182,7 +179,6 @@ def upload_file_kb_bulk(
     summary="Update an existing knowledge base",
     tags=["knowledge base"],
 )
-@error_handler
 def update_kb(project_id: str, kb_id: str, data: KnowledgeBase) -> KnowledgeBase:
     """
     Update an existing knowledge base.
@@ -201,7 +197,6 @@ def update_kb(project_id: str, kb_id: str, data: KnowledgeBase) -> KnowledgeBase
     summary="Update existing knowledge base in bulk",
     tags=["knowledge base"],
 )
-@error_handler
 def update_kb_bulk(project_id: str, data: list[KnowledgeBase]) -> list[KnowledgeBase]:
     """
     Update existing knowledge base in bulk.
@@ -220,7 +215,6 @@ def update_kb_bulk(project_id: str, data: list[KnowledgeBase]) -> list[Knowledge
     summary="Delete knowledge base",
     tags=["knowledge base"],
 )
-@error_handler
 def delete_kb(project_id: str, kb_id: str) -> ma.DeletedCount:
     """
     Delete knowledge base and all its data.
@@ -239,7 +233,6 @@ def delete_kb(project_id: str, kb_id: str) -> ma.DeletedCount:
     summary="Delete knowledge base in bulk",
     tags=["knowledge base"],
 )
-@error_handler
 def delete_kb_bulk(project_id: str, kb_ids: list[str]) -> ma.DeletedCount:
     """
     Delete knowledge base and all its data in bulk.
@@ -258,7 +251,6 @@ def delete_kb_bulk(project_id: str, kb_ids: list[str]) -> ma.DeletedCount:
     summary="Get resource file based on resource type",
     tags=["resources"],
 )
-@error_handler
 def get_resource(
         resource_type: ResourceType,
         project_id: str | None = None,
@@ -287,7 +279,6 @@ def get_resource(
     summary="Create/replace a resource file in storage",
     tags=["resources"],
 )
-@error_handler
 def post_resource(
         file: UploadFile,
         resource_type: ResourceType,
@@ -301,7 +292,7 @@ def post_resource(
     DEPRECATED! Use `POST /resources/{resource_type}/` instead!
     """
 
-    logger.warning("Deprecated endpoint called: POST /resources/{resource_type}", resource_type.value)
+    logger.warning("Deprecated endpoint called: POST /resources/%s", resource_type.value)
     return api_resources.post_resource(
         file=file,
         resource_type=ResourceType.SOURCE_KB if resource_type == ResourceType.SOURCE_FILE else resource_type,
@@ -318,7 +309,6 @@ def post_resource(
     summary="Remove a resource file from storage",
     tags=["resources"],
 )
-@error_handler
 def delete_resource(
         resource_type: ResourceType,
         project_id: str | None = None,
@@ -332,7 +322,7 @@ def delete_resource(
     DEPRECATED! Use `DELETE /resources/{resource_type}/` instead!
     """
 
-    logger.warning("Deprecated endpoint called: DELETE /resources/{resource_type}", resource_type.value)
+    logger.warning("Deprecated endpoint called: DELETE /resources/%s", resource_type.value)
     return api_resources.delete_resource(
         resource_type=ResourceType.SOURCE_KB if resource_type == ResourceType.SOURCE_FILE else resource_type,
         resource_id=kb_id or filename,
@@ -7,24 +7,29 @@
 """
 
 import hashlib
+import importlib.util
 import io
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
-import requests
+import httpx
 from fastapi import status
 from fastapi.datastructures import Headers, UploadFile
 from fastapi.exceptions import HTTPException
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
-from common.config import DF
+from common.config import CONFIG, DF
 from common.core import get_component_logger
+from common.core.middleware import submit_with_context
 from common.models import api as ma, api_ragnarok as mar
-from common.models.enums import MIME_TO_SOURCE, ResourceType, SOURCE_TO_MIME, SourceType
+from common.models.enums import MIME_TO_SOURCE, ResourceType, SOURCE_TO_MIME, SOURCE_TYPE_BY_VALUE, SourceType
 from common.models.knowledge_base import KnowledgeBase
-from common.utils.api import encode_header_string, error_handler
+from common.models.project import Project
+from common.utils import exceptions as exc
+from common.utils.api import encode_header_string, error_handler, paginated_json_response, parse_fields
 from kronos.services import ragnarok
 from kronos.services.crawler import CrawlOptions, Crawler
 from kronos.services.db.mongo import knowledge_base as db_kb, projects as db_projects
@@ -35,6 +40,15 @@ logger = get_component_logger()
 router = APIRouter()
 storage = get_storage()
 
+# Shared keep-alive client for downloading URL content (thread-safe, connections are reused across requests)
+# HTTP/2 (multiplexing requests to the same host over one connection) is used only if the optional h2 is installed
+http_client = httpx.Client(
+    http2=importlib.util.find_spec("h2") is not None,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(30.0, connect=10.0),
+)
+
 
 @router.get(
     "/",
@@ -52,7 +66,7 @@ def list_kb(
         sort_by: str = "",
         page_no: int = 1,
         per_page: int = 10,
-) -> ma.PaginatedKnowledgeBase | JSONResponse:
+) -> ma.PaginatedKnowledgeBase | Response:
     """
     List general info for knowledge bases.
 
@@ -67,7 +81,7 @@ def list_kb(
     :return: list of knowledge base data
     """
 
-    fields = {x.strip() for x in fields.split(",")} if fields else None
+    fields = parse_fields(fields)
 
     data, total = db_kb.list_kb(
         project_id=project_id,
@@ -83,7 +97,7 @@ def list_kb(
     pagination = ma.Pagination(page_no=page_no, per_page=per_page, total=total) if per_page > 0 else None
 
     if fields:
-        return JSONResponse(ma.PaginationBaseModel(data=data, pagination=pagination).model_dump(mode="json"))
+        return paginated_json_response(data=data, pagination=pagination)
     return ma.PaginatedKnowledgeBase(data=data, pagination=pagination)
 
 
@@ -123,7 +137,7 @@ def get_kb_source(project_id: str, kb_id: str, source_type: SourceType | None =
     """
 
     kb_data = db_kb.get_kb(kb_id=kb_id, fields={"source_file", "source_type"})
-    source_type = source_type or SourceType(kb_data["source_type"])
+    source_type = source_type or SOURCE_TYPE_BY_VALUE[kb_data["source_type"]]
 
     file_path = get_resource_paths(
         resource_type=ResourceType.SOURCE_KB,
@@ -178,49 +192,21 @@ def upload_file_kb(
     """
 
     project = db_projects.get_project_cached(project_id=project_id)
-    language = language or project.language
-    model_settings = project.ai_settings.retrieval.model
-
-    data = KnowledgeBase(
-        _id=kb_id,
-        project_id=project_id,
+    data = _upload_file_kb(
+        file=file,
+        project=project,
+        kb_id=kb_id,
+        source_file=source_file,
+        source_type=source_type,
         name=name,
         description=description,
         language=language,
-        source_file=source_file or file.filename,
-        source_type=source_type,
-        enable_highlights=enable_highlights,
-    )
-
-    metadata = ragnarok.upload_file_kb(
-        file=file.file,
-        project_id=project_id,
-        kb_id=data.id,
-        source_file=data.source_file,
-        source_type=data.source_type,
-        language=language,
-        model_settings=model_settings,
         custom_metadata=custom_metadata,
         enable_highlights=enable_highlights,
     )
 
-    data.custom_metadata = metadata.custom
-    data.embedding_model = metadata.embedding_model
-    data.total_pages = metadata.total_pages
-
-    file.file.seek(0)
-    file_path = get_resource_paths(
-        resource_type=ResourceType.SOURCE_KB,
-        resource_id=data.id,
-        project_id=project_id,
-        source_type=source_type,
-    )[0]
-    storage.post_file(file_path=file_path, content=file.file.read())
-
     db_projects.touch_project(project_id=project_id)
-    db_kb.delete_kb(kb_id=data.id, raise_not_found=False)
-    db_kb.create_kb(data=data)
-    return db_kb.get_kb(kb_id=data.id)
+    return data
 
 
 @router.post(
@@ -257,21 +243,28 @@ def upload_file_kb_bulk(
     """
 
     source_path = Path(source_path) if source_path else None
+    project = db_projects.get_project_cached(project_id=project_id)
 
-    return [
-        upload_file_kb(
-            file=file,
-            project_id=project_id,
-            source_file=str(source_path / file.filename) if source_path else None,
-            source_type=source_type,
-            name=name,
-            description=description,
-            language=language,
-            custom_metadata=custom_metadata,
-            enable_highlights=enable_highlights,
-        )
-        for file in files
-    ]
+    with _bulk_executor(len(files)) as executor:
+        futures = [
+            submit_with_context(
+                executor,
+                _upload_file_kb,
+                file=file,
+                project=project,
+                source_file=str(source_path / file.filename) if source_path else None,
+                source_type=source_type,
+                name=name,
+                description=description,
+                language=language,
+                custom_metadata=custom_metadata,
+                enable_highlights=enable_highlights,
+            )
+            for file in files
+        ]
+
+    db_projects.touch_project(project_id=project_id)
+    return [f.result() for f in futures]
 
 
 @router.post(
@@ -344,7 +337,7 @@ def upload_marker_kb(
         project_id=project_id,
         source_type=SourceType.PDF,
     )[0]
-    storage.post_file(file_path=file_path, content=files["pdf"].file.read())
+    storage.post_file_stream(file_path=file_path, fileobj=files["pdf"].file, size=files["pdf"].size)
 
     db_kb.COLL_KB.update_one({"_id": data.id}, {"$set": {"source_type": SourceType.PDF.value}})
     return db_kb.get_kb(kb_id=data.id)
@@ -383,16 +376,11 @@ def upload_url_kb(
     :return: created knowledge base data
     """
 
-    content = io.BytesIO(requests.get(url, timeout=(10, 30)).content)
-    headers = Headers({"Content-Type": SOURCE_TO_MIME[SourceType.HTML]})
-    file = UploadFile(file=content, filename="from_url.html", headers=headers)
-
-    return upload_file_kb(
-        file=file,
-        project_id=project_id,
+    project = db_projects.get_project_cached(project_id=project_id)
+    data = _upload_url_kb(
+        url=url,
+        project=project,
         kb_id=kb_id,
-        source_file=url,
-        source_type=SourceType.HTML,
         name=name,
         description=description,
         language=language,
@@ -400,6 +388,9 @@ def upload_url_kb(
         enable_highlights=enable_highlights,
     )
 
+    db_projects.touch_project(project_id=project_id)
+    return data
+
 
 @router.post(
     "/url/bulk",
@@ -430,18 +421,26 @@ def upload_url_kb_bulk(
     :return: created knowledge base data
     """
 
-    return [
-        upload_url_kb(
-            url=url,
-            project_id=project_id,
-            name=name,
-            description=description,
-            language=language,
-            custom_metadata=custom_metadata,
-            enable_highlights=enable_highlights,
-        )
-        for url in urls
-    ]
+    project = db_projects.get_project_cached(project_id=project_id)
+
+    with _bulk_executor(len(urls)) as executor:
+        futures = [
+            submit_with_context(
+                executor,
+                _upload_url_kb,
+                url=url,
+                project=project,
+                name=name,
+                description=description,
+                language=language,
+                custom_metadata=custom_metadata,
+                enable_highlights=enable_highlights,
+            )
+            for url in urls
+        ]
+
+    db_projects.touch_project(project_id=project_id)
+    return [f.result() for f in futures]
 
 
 @router.post(
@@ -473,52 +472,92 @@ def upload_url_kb_crawl(
     :return: created knowledge base data
     """
 
+    project = None if dry_run else db_projects.get_project_cached(project_id=project_id)
     if not language:
-        language = DF.LANG if dry_run else db_projects.get_project_cached(project_id=project_id).language
+        language = DF.LANG if dry_run else project.language
 
     crawler = Crawler(start_url=url, opts=opts)
-    out: list[KnowledgeBase] = []
-
-    for s in crawler.crawl():
-        try:
-            kb_id = _stable_kb_id_for_url(project_id=project_id, url=s.url_final) if idempotent_ids else ""
-
-            if dry_run:
-                out.append(
-                    KnowledgeBase(
-                        _id=kb_id,
-                        project_id=project_id,
-                        name=s.title or os.path.basename(urlparse(s.url_final).path),
-                        embedding_model=DF.MODEL_EMB,
+    # entries in crawl order: already available KB data or (URL, upload future) pairs
+    entries: list[KnowledgeBase | tuple[str, Future]] = []
+    n_uploads = 0
+
+    # uploads of the discovered content run in the background while crawling continues
+    with _bulk_executor() as executor:
+        for s in crawler.crawl():
+            try:
+                url_final = s.url_final
+                kb_id = _stable_kb_id_for_url(project_id=project_id, url=url_final) if idempotent_ids else ""
+                kb_name = s.title or os.path.basename(urlparse(url_final).path)
+                source_type = MIME_TO_SOURCE[s.mimetype]
+
+                if dry_run:
+                    s.close()
+                    entries.append(
+                        KnowledgeBase(
+                            _id=kb_id,
+                            project_id=project_id,
+                            name=kb_name,
+                            embedding_model=DF.MODEL_EMB,
+                            language=language,
+                            source_file=url_final,
+                            source_type=source_type,
+                            enable_highlights=enable_highlights,
+                        ),
+                    )
+                    continue
+
+                # unchanged content of an already uploaded page does not need to be re-processed
+                if kb_id and (kb := _get_unchanged_kb(
+                        kb_id=kb_id,
+                        project=project,
+                        content_hash=s.content_hash,
                         language=language,
-                        source_file=s.url_final,
-                        source_type=MIME_TO_SOURCE[s.mimetype],
                         enable_highlights=enable_highlights,
-                    ),
-                )
-                continue
-
-            content = io.BytesIO(s.content)
-            headers = Headers({"Content-Type": s.mimetype})
-            file = UploadFile(file=content, filename="from_url.bin", headers=headers)
-
-            out.append(
-                upload_file_kb(
+                )):
+                    s.close()
+                    entries.append(kb)
+                    continue
+
+                # the downloaded content stream is passed through without copying (closed once uploaded)
+                headers = Headers({"Content-Type": s.mimetype})
+                file = UploadFile(file=s.stream, size=s.size, filename="from_url.bin", headers=headers)
+
+                future = submit_with_context(
+                    executor,
+                    _upload_file_kb,
                     file=file,
-                    project_id=project_id,
+                    project=project,
                     kb_id=kb_id,
-                    source_file=s.url_final,
-                    source_type=MIME_TO_SOURCE[s.mimetype],
-                    name=s.title or os.path.basename(urlparse(s.url_final).path),
+                    source_file=url_final,
+                    source_type=source_type,
+                    name=kb_name,
                     language=language,
                     enable_highlights=enable_highlights,
-                ),
-            )
+                    content_hash=s.content_hash,
+                )
+                future.add_done_callback(lambda _, stream=file.file: stream.close())
+                entries.append((url_final, future))
+                n_uploads += 1
 
-        except Exception as e:
-            logger.error("Failed to upload scraped KB -> skipping URL %s: %s", s.url_final, e)
+            except Exception as e:
+                s.close()
+                logger.error("Failed to upload scraped KB -> skipping URL %s: %s", s.url_final, e)
+                continue
+
+    out: list[KnowledgeBase] = []
+    for entry in entries:
+        if isinstance(entry, KnowledgeBase):
+            out.append(entry)
             continue
 
+        url_final, future = entry
+        try:
+            out.append(future.result())
+        except Exception as e:
+            logger.error("Failed to upload scraped KB -> skipping URL %s: %s", url_final, e)
+
+    if n_uploads:
+        db_projects.touch_project(project_id=project_id)
     return out
 
 
@@ -559,13 +598,20 @@ def update_kb_bulk(data: list[KnowledgeBase]) -> list[KnowledgeBase]:
     """
     Update existing knowledge base in bulk.
 
-    ToDo: Use bulk update in DB instead of a for cycle.
-
     :param data: list of knowledge base data for update
     :return: updated knowledge base data
     """
 
-    return [update_kb(kb_id=d.id, data=d) for d in data]
+    for d in data:
+        data_updated = d.model_dump(exclude_unset=True)
+        data_updated["custom"] = data_updated.pop("custom_metadata", {})
+        ragnarok.update_kb_metadata(kb_id=d.id, metadata=mar.KBMetadataUpdate.model_validate(data_updated))
+
+    for project_id in {d.project_id for d in data}:
+        db_projects.touch_project(project_id=project_id)
+
+    db_kb.update_kb_bulk(data=data)
+    return db_kb.get_kb_bulk(kb_ids=[d.id for d in data])
 
 
 @router.delete(
@@ -604,25 +650,181 @@ def delete_kb_bulk(project_id: str, kb_ids: list[str]) -> ma.DeletedCount:
     """
     Delete knowledge base and all its data in bulk.
 
-    ToDo: Use bulk delete wherever possible instead of a for cycle.
-
     :param project_id: project ID
     :param kb_ids: knowledge base IDs to delete
     :return: deleted count
     """
 
-    deleted = ma.DeletedCount()
-
-    for kb_id in kb_ids:
-        deleted_tmp = delete_kb(project_id=project_id, kb_id=kb_id)
-        deleted.deleted_db_knowledge_base += deleted_tmp.deleted_db_knowledge_base
-        deleted.deleted_es_chunks += deleted_tmp.deleted_es_chunks
-        deleted.deleted_es_chunks_highlight += deleted_tmp.deleted_es_chunks_highlight
-        deleted.deleted_storage_blobs += deleted_tmp.deleted_storage_blobs
+    if not kb_ids:
+        return ma.DeletedCount()
 
+    deleted = ragnarok.delete_kb_bulk(kb_ids=kb_ids)
+    deleted.deleted_db_knowledge_base = db_kb.delete_kb_bulk(kb_ids=kb_ids)
+    deleted.deleted_storage_blobs = storage.delete_folders(
+        folder_paths=[
+            get_resource_dir(resource_type=ResourceType.SOURCE_KB, resource_id=kb_id, project_id=project_id)
+            for kb_id in kb_ids
+        ],
+    )
+    db_projects.touch_project(project_id=project_id)
     return deleted
 
 
+def _upload_file_kb(
+        file: UploadFile,
+        project: Project,
+        kb_id: str = "",
+        source_file: str = "",
+        source_type: SourceType = SourceType.PDF,
+        name: str = "",
+        description: str = "",
+        language: str = "",
+        custom_metadata: str = "",
+        enable_highlights: bool = False,
+        content_hash: str = "",
+) -> KnowledgeBase:
+    """
+    Upload file as knowledge base for an already resolved project (the project modified time is not updated).
+
+    Used by the bulk endpoints, so that the project is resolved and touched only once per request.
+    See `upload_file_kb` for the other parameters.
+
+    :param content_hash: hash of the source content (stored to detect unchanged content on re-upload)
+    """
+
+    project_id = project.id
+    language = language or project.language
+    model_settings = project.ai_settings.retrieval.model
+
+    data = KnowledgeBase(
+        _id=kb_id,
+        project_id=project_id,
+        name=name,
+        description=description,
+        language=language,
+        source_file=source_file or file.filename,
+        source_type=source_type,
+        content_hash=content_hash,
+        enable_highlights=enable_highlights,
+    )
+
+    metadata = ragnarok.upload_file_kb(
+        file=file.file,
+        project_id=project_id,
+        kb_id=data.id,
+        source_file=data.source_file,
+        source_type=data.source_type,
+        language=language,
+        model_settings=model_settings,
+        custom_metadata=custom_metadata,
+        enable_highlights=enable_highlights,
+    )
+
+    data.custom_metadata = metadata.custom
+    data.embedding_model = metadata.embedding_model
+    data.total_pages = metadata.total_pages
+
+    file.file.seek(0)
+    file_path = get_resource_paths(
+        resource_type=ResourceType.SOURCE_KB,
+        resource_id=data.id,
+        project_id=project_id,
+        source_type=source_type,
+    )[0]
+    storage.post_file_stream(file_path=file_path, fileobj=file.file, size=file.size)
+
+    db_kb.delete_kb(kb_id=data.id, raise_not_found=False)
+    db_kb.create_kb(data=data)
+    return db_kb.get_kb(kb_id=data.id)
+
+
+def _upload_url_kb(
+        url: str,
+        project: Project,
+        kb_id: str = "",
+        name: str = "",
+        description: str = "",
+        language: str = "",
+        custom_metadata: str = "",
+        enable_highlights: bool = False,
+) -> KnowledgeBase:
+    """
+    Upload URL content as knowledge base for an already resolved project (the project modified time is not updated).
+
+    See `upload_url_kb` for the parameters.
+    """
+
+    content = io.BytesIO(http_client.get(url).content)
+    headers = Headers({"Content-Type": SOURCE_TO_MIME[SourceType.HTML]})
+    file = UploadFile(file=content, filename="from_url.html", headers=headers)
+
+    return _upload_file_kb(
+        file=file,
+        project=project,
+        kb_id=kb_id,
+        source_file=url,
+        source_type=SourceType.HTML,
+        name=name,
+        description=description,
+        language=language,
+        custom_metadata=custom_metadata,
+        enable_highlights=enable_highlights,
+    )
+
+
+def _get_unchanged_kb(
+        kb_id: str,
+        project: Project,
+        content_hash: str | None,
+        language: str,
+        enable_highlights: bool,
+) -> KnowledgeBase | None:
+    """
+    Get an existing knowledge base if it was built from the same content with the same settings.
+
+    :param kb_id: knowledge base ID
+    :param project: project data
+    :param content_hash: hash of the new content
+    :param language: text language of the new upload
+    :param enable_highlights: highlights flag of the new upload
+    :return: existing knowledge base data (None if missing or changed)
+    """
+
+    if not content_hash:
+        return None
+
+    try:
+        kb = db_kb.get_kb(kb_id=kb_id)
+    except exc.DBRecordNotFound:
+        return None
+
+    if (
+            kb.content_hash != content_hash
+            or kb.project_id != project.id
+            or kb.language != language
+            or kb.enable_highlights != enable_highlights
+            or kb.embedding_model != project.ai_settings.retrieval.model.name
+    ):
+        return None
+
+    return kb
+
+
+def close_http_client():
+    """Close the shared HTTP client (call on app shutdown)."""
+    http_client.close()
+
+
+def _bulk_executor(n_items: int | None = None) -> ThreadPoolExecutor:
+    """Get thread pool executor for the bulk knowledge base uploads."""
+
+    max_workers = CONFIG.KB_BULK_UPLOAD_CONCURRENCY
+    if n_items is not None:
+        max_workers = max(1, min(max_workers, n_items))
+
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kb-upload")
+
+
 def _stable_kb_id_for_url(project_id: str, url: str) -> str:
     """
     Get a stable knowledge base ID for a given URL.
@@ -6,16 +6,18 @@
     NLP / text processing endpoints.
 """
 
-import json
-from typing import Any, Generator
+from typing import Any, AsyncGenerator, AsyncIterator
 
 from fastapi import status
 from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 from common.config import CONFIG
 from common.models import api_kronos as mak, api_ragnarok as mar, elastic as me
-from common.utils.api import error_handler, error_handler_async
+from common.models.enums import SOURCE_TYPE_BY_VALUE
+from common.utils import fast_json
+from common.utils.api import error_handler_async
 from kronos.services import ragnarok
 from kronos.services.db.mongo.knowledge_base import get_kb_bulk
 from kronos.services.db.mongo.projects import get_project_cached
@@ -54,25 +56,15 @@ async def rag_pipeline(project_id: str, payload: mak.RAGPayload, session_id: str
     :return: RAG response
     """
 
-    _fill_default_settings(project_id=project_id, payload=payload)
-
-    if CONFIG.CONTEXT_ENABLED and not payload.context and session_id:
-        turns, _ = list_turns(
-            session_id=session_id,
-            project_id=project_id,
-            fields={"created_at", "system_response", "user_query"},
-            sort_by="created_at",
-            per_page=CONFIG.CONTEXT_WINDOW_SIZE,
-        )
-
-        payload.context = [mar.ConversationTurn.model_validate(t) for t in turns]
+    # the DB lookups are blocking, do not run them on the event loop
+    await run_in_threadpool(_prepare_payload, project_id, payload, session_id)
 
     res = await ragnarok.query_rag(project_id=project_id, payload=payload)
 
     return mak.RAGResponse(
         generated_text=res.generated_text,
         highlights=res.highlights,
-        matched_chunks=_update_matched_chunks(res.matched_chunks),
+        matched_chunks=await run_in_threadpool(_update_matched_chunks, res.matched_chunks),
     )
 
 
@@ -82,8 +74,8 @@ async def rag_pipeline(project_id: str, payload: mak.RAGPayload, session_id: str
     status_code=status.HTTP_200_OK,
     summary="Run RAG pipeline and get streamed response",
 )
-@error_handler
-def rag_pipeline_stream(project_id: str, payload: mak.RAGPayload, session_id: str = "") -> StreamingResponse:
+@error_handler_async
+async def rag_pipeline_stream(project_id: str, payload: mak.RAGPayload, session_id: str = "") -> StreamingResponse:
     """
     Run RAG pipeline and get streamed response.
 
@@ -116,6 +108,16 @@ def rag_pipeline_stream(project_id: str, payload: mak.RAGPayload, session_id: st
     :return: streamed RAG response (see description)
     """
 
+    # the DB lookups are blocking, do not run them on the event loop
+    await run_in_threadpool(_prepare_payload, project_id, payload, session_id)
+
+    res = await ragnarok.query_rag_stream(project_id=project_id, payload=payload)
+    return StreamingResponse(_streamed_rag_response(text_gen=res), media_type="application/x-ndjson")
+
+
+def _prepare_payload(project_id: str, payload: mak.RAGPayload, session_id: str):
+    """Fill default project settings and conversation history (by session ID) in the payload."""
+
     _fill_default_settings(project_id=project_id, payload=payload)
 
     if CONFIG.CONTEXT_ENABLED and not payload.context and session_id:
@@ -129,9 +131,6 @@ def rag_pipeline_stream(project_id: str, payload: mak.RAGPayload, session_id: st
 
         payload.context = [mar.ConversationTurn.model_validate(t) for t in turns]
 
-    res = ragnarok.query_rag_stream(project_id=project_id, payload=payload)
-    return StreamingResponse(_streamed_rag_response(text_gen=res), media_type="application/x-ndjson")
-
 
 def _fill_default_settings(project_id: str, payload: mak.RAGPayload):
     """Fill missing/empty values in the payload with default project settings."""
@@ -153,29 +152,52 @@ def _update_matched_chunks(
     if not matched_chunks:
         return matched_chunks
 
-    if not (dict_input := isinstance(matched_chunks[0], dict)):
-        matched_chunks = [x.model_dump() for x in matched_chunks]
-    matched_chunks = [mak.KBEntry.model_validate(x) for x in matched_chunks]
+    # chunks often come from the same KB, fetch each KB only once
+    if dict_input := isinstance(matched_chunks[0], dict):
+        ids = list({x["_source"]["metadata"]["kb_id"]: None for x in matched_chunks})
+    else:
+        ids = list({x.source.metadata.kb_id: None for x in matched_chunks})
 
-    ids = [x.source.metadata.kb_id for x in matched_chunks]
     data = get_kb_bulk(kb_ids=ids, fields={"name", "description", "source_file", "source_type"})
+    data_by_id = {d.pop("_id"): d for d in data}
 
-    for chunk, d in zip(matched_chunks, data):
-        chunk.source.metadata.name = d["name"]
-        chunk.source.metadata.description = d["description"]
-        chunk.source.metadata.source_file = d["source_file"]
-        chunk.source.metadata.source_type = d["source_type"]
+    # already (de)serialized chunks are updated in place (no re-validation of the whole chunks)
+    if dict_input:
+        for chunk in matched_chunks:
+            chunk["_source"]["metadata"].update(data_by_id[chunk["_source"]["metadata"]["kb_id"]])
+        return matched_chunks
 
-    return [x.model_dump(mode="json") for x in matched_chunks] if dict_input else matched_chunks
+    return [_to_kronos_kb_entry(chunk, data_by_id[chunk.source.metadata.kb_id]) for chunk in matched_chunks]
 
 
-def _streamed_rag_response(text_gen: Generator[str, None, None]) -> Generator[str, None, None]:
-    """Generate ndjson chunks for the streamed RAG response."""
+def _to_kronos_kb_entry(chunk: me.KBEntry, data: dict[str, Any]) -> mak.KBEntry:
+    """Build the Kronos KB entry from an already validated chunk and KB data from DB (without re-validation)."""
 
-    for chunk in text_gen:
-        if not (decoded_chunk := json.loads(chunk))["is_last_chunk"]:
-            yield f"{chunk}\n"
+    metadata = chunk.source.metadata
+    metadata = mak.KBMetadata.model_construct(
+        _fields_set=metadata.model_fields_set | data.keys(),
+        **{**metadata.__dict__, **data, "source_type": SOURCE_TYPE_BY_VALUE[data["source_type"]]},
+    )
+    source = mak.KBSource.model_construct(
+        _fields_set=chunk.source.model_fields_set,
+        **{**chunk.source.__dict__, "metadata": metadata},
+    )
+    return mak.KBEntry.model_construct(_fields_set=chunk.model_fields_set, **{**chunk.__dict__, "source": source})
+
+
+async def _streamed_rag_response(text_gen: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """Generate ndjson chunks for the streamed RAG response (passed through as bytes without re-encoding)."""
+
+    async for chunk in text_gen:
+        # text chunks and last chunks without matched chunks (not requested) are passed through unchanged
+        decoded_chunk = fast_json.loads(chunk)
+        if not decoded_chunk["is_last_chunk"] or not decoded_chunk.get("matched_chunks"):
+            yield chunk + b"\n"
             continue
 
-        decoded_chunk["matched_chunks"] = _update_matched_chunks(decoded_chunk.get("matched_chunks"))
-        yield f"{json.dumps(decoded_chunk)}\n"
+        # the DB lookup is blocking, do not run it on the event loop
+        decoded_chunk["matched_chunks"] = await run_in_threadpool(
+            _update_matched_chunks,
+            decoded_chunk.get("matched_chunks"),
+        )
+        yield fast_json.dumps(decoded_chunk) + b"\n"
@@ -6,13 +6,16 @@
     Project management endpoints.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
+from common.core.middleware import submit_with_context
 from common.models import api as ma
 from common.models.project import Project
-from common.utils.api import error_handler
+from common.utils.api import error_handler, paginated_json_response, parse_fields
 from kronos.services import ragnarok
 from kronos.services.db.mongo import (
     knowledge_base as db_kb,
@@ -42,7 +45,7 @@ def list_projects(
         sort_by: str = "",
         page_no: int = 1,
         per_page: int = 10,
-) -> ma.PaginatedProjects | JSONResponse:
+) -> ma.PaginatedProjects | Response:
     """
     List general info for all available projects.
 
@@ -58,7 +61,7 @@ def list_projects(
     :return: list of projects
     """
 
-    fields = {x.strip() for x in fields.split(",")} if fields else None
+    fields = parse_fields(fields)
 
     data, total = db_projects.list_projects(
         name=name,
@@ -73,7 +76,7 @@ def list_projects(
     pagination = ma.Pagination(page_no=page_no, per_page=per_page, total=total) if per_page > 0 else None
 
     if fields:
-        return JSONResponse(ma.PaginationBaseModel(data=data, pagination=pagination).model_dump(mode="json"))
+        return paginated_json_response(data=data, pagination=pagination)
     return ma.PaginatedProjects(data=data, pagination=pagination)
 
 
@@ -88,11 +91,13 @@ def get_project(project_id: str) -> Project:
     """
     Get project data.
 
+    The data is served from a short-lived cache (changes made through other instances may take a few seconds).
+
     :param project_id: project ID
     :return: project data
     """
 
-    return db_projects.get_project(project_id=project_id)
+    return db_projects.get_project_cached(project_id=project_id)
 
 
 @router.post(
@@ -110,8 +115,8 @@ def create_project(data: Project) -> Project:
     :return: created project data
     """
 
-    project_id = db_projects.create_project(data=data)
-    return db_projects.get_project(project_id=project_id)
+    db_projects.create_project(data=data)
+    return data
 
 
 @router.put(
@@ -131,8 +136,7 @@ def update_project(project_id: str, data: Project) -> Project:
     """
 
     data.id = project_id
-    db_projects.update_project(data=data)
-    return db_projects.get_project(project_id=project_id)
+    return db_projects.update_project(data=data)
 
 
 @router.delete(
@@ -151,13 +155,28 @@ def delete_project(project_id: str, delete_sessions: bool = False) -> ma.Deleted
     :return: deleted count
     """
 
-    deleted = ragnarok.delete_project(project_id=project_id)
-    deleted.deleted_db_knowledge_base = db_kb.delete_kb_for_project(project_id=project_id)
-    deleted.deleted_db_projects = db_projects.delete_project(project_id=project_id)
-    deleted.deleted_storage_blobs = storage.delete_folder(folder_path=DIR_PROJECT.format(project_id=project_id))
+    # the deletions touch independent backends (and are idempotent), run them concurrently
+    with ThreadPoolExecutor(max_workers=6, thread_name_prefix="project-delete") as executor:
+        f_ragnarok = submit_with_context(executor, ragnarok.delete_project, project_id=project_id)
+        f_kb = submit_with_context(executor, db_kb.delete_kb_for_project, project_id=project_id)
+        f_projects = submit_with_context(executor, db_projects.delete_project, project_id=project_id)
+        f_storage = submit_with_context(
+            executor,
+            storage.delete_folder,
+            folder_path=DIR_PROJECT.format(project_id=project_id),
+        )
+
+        if delete_sessions:
+            f_sessions = submit_with_context(executor, db_sessions.delete_sessions_for_project, project_id=project_id)
+            f_turns = submit_with_context(executor, db_turns.delete_turns_for_project, project_id=project_id)
+
+    deleted = f_ragnarok.result()
+    deleted.deleted_db_knowledge_base = f_kb.result()
+    deleted.deleted_db_projects = f_projects.result()
+    deleted.deleted_storage_blobs = f_storage.result()
 
     if delete_sessions:
-        deleted.deleted_db_sessions = db_sessions.delete_sessions_for_project(project_id=project_id)
-        deleted.deleted_db_turns = db_turns.delete_turns_for_project(project_id=project_id)
+        deleted.deleted_db_sessions = f_sessions.result()
+        deleted.deleted_db_turns = f_turns.result()
 
     return deleted
@@ -6,7 +6,7 @@
     Endpoints for managing resources (files) in the storage.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import status
 from fastapi.datastructures import UploadFile
@@ -14,9 +14,10 @@ from fastapi.exceptions import HTTPException
 from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
+from common.core.middleware import submit_with_context
 from common.models import api as ma, api_kronos as mak
 from common.models.enums import RESOURCE_TO_MIME, ResourceType, SOURCE_TO_MIME, SourceType
-from common.utils import exceptions as exc
+from common.utils import exceptions as exc, fast_json
 from common.utils.api import error_handler
 from kronos.api import knowledge_base as kb_api
 from kronos.services.db.mongo import projects as db_projects
@@ -26,6 +27,9 @@ from kronos.services.storage.base import DIR_PROJECT, get_resource_dir, get_reso
 router = APIRouter()
 storage = get_storage()
 
+# shared executor for probing the fallback resource locations
+_probe_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="resource-probe")
+
 
 @router.get(
     "/",
@@ -60,7 +64,14 @@ def list_resources(
         # Only documents and KB have their own ID -> check their locations
         dir_doc = get_resource_dir(ResourceType.SOURCE_DOCUMENT, resource_id=resource_id, project_id=project_id)
         dir_kb = get_resource_dir(ResourceType.SOURCE_KB, resource_id=resource_id, project_id=project_id)
-        res = storage.list_files(prefix=dir_kb) or storage.list_files(prefix=dir_doc)
+
+        # list only the location that can match the requested source type (single storage listing)
+        if resource_type == ResourceType.SOURCE_KB:
+            res = storage.list_files(prefix=dir_kb)
+        elif resource_type == ResourceType.SOURCE_DOCUMENT:
+            res = storage.list_files(prefix=dir_doc)
+        else:
+            res = storage.list_files(prefix=dir_kb) or storage.list_files(prefix=dir_doc)
 
     elif project_id:
         # Check all project resources
@@ -132,15 +143,7 @@ def get_resource(
         source_type=source_type,
     )
 
-    content = None
-    for path in paths:
-        try:
-            content = storage.get_file(file_path=path)
-            break
-        except exc.ResourceNotFound:
-            continue
-
-    if not content:
+    if not (content := _get_first_file(paths)):
         raise exc.ResourceNotFound(resource_id=paths[-1])
 
     mimetype = RESOURCE_TO_MIME[resource_type] or SOURCE_TO_MIME.get(source_type) or "application/octet-stream"
@@ -192,7 +195,7 @@ def post_resource(
     )[0]
 
     db_projects.touch_project(project_id=project_id)
-    storage.post_file(file_path=file_path, content=file.file.read())
+    storage.post_file_stream(file_path=file_path, fileobj=file.file, size=file.size)
     return file_path
 
 
@@ -283,23 +286,45 @@ def delete_resource(
     return ma.DeletedCount(deleted_storage_blobs=storage.delete_file(file_path=file_path))
 
 
+def shutdown_probe_executor():
+    """Shut down the executor used for probing resource locations (call on app shutdown)."""
+    _probe_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_first_file(paths: list[str]) -> bytes | None:
+    """Get content of the first existing file (existence of the paths is probed concurrently, one download)."""
+
+    if len(paths) > 1:
+        futures = [submit_with_context(_probe_executor, storage.exists, path) for path in paths]
+        paths = [path for path, f in zip(paths, futures) if f.result()][:1]
+
+    for path in paths:
+        try:
+            return storage.get_file(file_path=path)
+        except exc.ResourceNotFound:
+            continue
+
+    return None
+
+
 def _init_dialogue_fsm(content: bytes, updates: mak.ResourceInit) -> bytes | None:
     """Initialize default FSM JSON with the provided values."""
 
-    data = json.loads(content)
-    states = data.get("states", [])
+    data = fast_json.loads(content)
+    # states by ID (reversed -> the first state wins for duplicate IDs), entries reference the states in data
+    states = {s["state_id"]: s for s in reversed(data.get("states", []))}
     updated = False
 
     if updates.chatbot:
         data["chatbot"] = updates.chatbot.model_dump()
         updated = True
 
-    if updates.image_url and (state := next((s for s in states if s["state_id"] == updates.image_url_state_id), None)):
+    if updates.image_url and (state := states.get(updates.image_url_state_id)):
         state["command"]["text"] = updates.image_url
         updated = True
 
-    if updates.message and (state := next((s for s in states if s["state_id"] == updates.message_state_id), None)):
+    if updates.message and (state := states.get(updates.message_state_id)):
         state["command"]["text"] = updates.message
         updated = True
 
-    return json.dumps(data, indent=2).encode("utf-8") if updated else None
+    return fast_json.dumps(data, indent=True) if updated else None
@@ -7,12 +7,13 @@
 """
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import HTTPException
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
 from common.models import api as ma
 from common.models.session import Session
-from common.utils.api import error_handler
+from common.utils.api import error_handler, get_next_cursor, paginated_json_response, parse_fields
 from kronos.services.db.mongo import sessions as db_sessions, turns as db_turns
 
 router = APIRouter()
@@ -34,10 +35,14 @@ def list_sessions(
         sort_by: str = "",
         page_no: int = 1,
         per_page: int = 10,
-) -> ma.PaginatedSessions | JSONResponse:
+        cursor: str = "",
+) -> ma.PaginatedSessions | Response:
     """
     List general info for sessions.
 
+    Deep pages can be listed efficiently with keyset pagination: order by `-_id` (newest first) and pass
+    the `next_cursor` from the pagination of the previous page as `cursor` (`page_no` is ignored then).
+
     :param document_id: document ID
     :param project_id: project ID
     :param user_id: user ID
@@ -46,10 +51,14 @@ def list_sessions(
     :param sort_by: field name to sort by (for descending order user prefix "-")
     :param page_no: [pagination] page number
     :param per_page: [pagination] results per page (use 0 for no pagination)
+    :param cursor: [pagination] keyset pagination cursor - `next_cursor` from the previous page
     :return: list of sessions data
     """
 
-    fields = {x.strip() for x in fields.split(",")} if fields else None
+    if cursor and sort_by not in ("", "-_id"):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Cursor pagination supports only the '-_id' ordering")
+
+    fields = parse_fields(fields)
 
     data, total = db_sessions.list_sessions(
         document_id=document_id,
@@ -60,12 +69,16 @@ def list_sessions(
         sort_by=sort_by,
         page_no=page_no,
         per_page=per_page,
+        cursor=cursor or None,
     )
 
-    pagination = ma.Pagination(page_no=page_no, per_page=per_page, total=total) if per_page > 0 else None
+    pagination = None
+    if per_page > 0:
+        next_cursor = get_next_cursor(data, per_page=per_page) if cursor or sort_by == "-_id" else None
+        pagination = ma.Pagination(page_no=page_no, per_page=per_page, total=total, next_cursor=next_cursor)
 
     if fields:
-        return JSONResponse(ma.PaginationBaseModel(data=data, pagination=pagination).model_dump(mode="json"))
+        return paginated_json_response(data=data, pagination=pagination)
     return ma.PaginatedSessions(data=data, pagination=pagination)
 
 
@@ -102,8 +115,8 @@ def create_session(data: Session) -> Session:
     :return: created session data
     """
 
-    session_id = db_sessions.create_session(data=data)
-    return db_sessions.get_session(session_id=session_id)
+    db_sessions.create_session(data=data)
+    return data
 
 
 @router.put(
@@ -123,8 +136,7 @@ def update_session(session_id: str, data: Session) -> Session:
     """
 
     data.id = session_id
-    db_sessions.update_session(data=data)
-    return db_sessions.get_session(session_id=session_id)
+    return db_sessions.update_session(data=data)
 
 
 @router.delete(
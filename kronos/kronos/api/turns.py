@@ -7,12 +7,13 @@
 """
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import HTTPException
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
 from common.models import api as ma
 from common.models.turn import Turn
-from common.utils.api import error_handler
+from common.utils.api import error_handler, get_next_cursor, paginated_json_response, parse_fields
 from kronos.services.db.mongo import sessions as db_sessions, turns as db_turns
 
 router = APIRouter()
@@ -33,10 +34,14 @@ def list_turns(
         sort_by: str = "",
         page_no: int = 1,
         per_page: int = 10,
-) -> ma.PaginatedTurns | JSONResponse:
+        cursor: str = "",
+) -> ma.PaginatedTurns | Response:
     """
     List general info for turns.
 
+    Deep pages can be listed efficiently with keyset pagination: order by `-_id` (newest first) and pass
+    the `next_cursor` from the pagination of the previous page as `cursor` (`page_no` is ignored then).
+
     :param session_id: session ID
     :param project_id: project ID
     :param user_id: user ID
@@ -44,10 +49,14 @@ def list_turns(
     :param sort_by: field name to sort by (for descending order user prefix "-")
     :param page_no: [pagination] page number
     :param per_page: [pagination] results per page (use 0 for no pagination)
+    :param cursor: [pagination] keyset pagination cursor - `next_cursor` from the previous page
     :return: list of turns data
     """
 
-    fields = {x.strip() for x in fields.split(",")} if fields else None
+    if cursor and sort_by not in ("", "-_id"):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Cursor pagination supports only the '-_id' ordering")
+
+    fields = parse_fields(fields)
 
     data, total = db_turns.list_turns(
         session_id=session_id,
@@ -57,12 +66,16 @@ def list_turns(
         sort_by=sort_by,
         page_no=page_no,
         per_page=per_page,
+        cursor=cursor or None,
     )
 
-    pagination = ma.Pagination(page_no=page_no, per_page=per_page, total=total) if per_page > 0 else None
+    pagination = None
+    if per_page > 0:
+        next_cursor = get_next_cursor(data, per_page=per_page) if cursor or sort_by == "-_id" else None
+        pagination = ma.Pagination(page_no=page_no, per_page=per_page, total=total, next_cursor=next_cursor)
 
     if fields:
-        return JSONResponse(ma.PaginationBaseModel(data=data, pagination=pagination).model_dump(mode="json"))
+        return paginated_json_response(data=data, pagination=pagination)
     return ma.PaginatedTurns(data=data, pagination=pagination)
 
 
@@ -100,8 +113,8 @@ def create_turn(data: Turn) -> Turn:
     """
 
     db_sessions.set_first_user_query(session_id=data.session_id, query=data.user_query)
-    turn_id = db_turns.create_turn(data=data)
-    return db_turns.get_turn(turn_id=turn_id)
+    db_turns.create_turn(data=data)
+    return data
 
 
 @router.delete(
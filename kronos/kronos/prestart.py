@@ -8,11 +8,13 @@
 
 from datetime import datetime
 from time import sleep
-from typing import Any
+from typing import Any, Callable
 
 import pymongo
 from dateutil import tz
-from pymongo import ReplaceOne, UpdateOne
+from pydantic import BaseModel
+from pymongo import IndexModel, ReplaceOne, UpdateOne
+from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
 from common.core import get_component_logger
@@ -31,20 +33,37 @@ LOCK_NAME = "db_migration"
 
 INDEXES = {
     Coll.KB: [
-        (("project_id", pymongo.ASCENDING), {"background": True}),
+        IndexModel([("project_id", pymongo.ASCENDING)], background=True),
     ],
     Coll.SESSIONS: [
-        (("document_id", pymongo.ASCENDING), {"background": True}),
-        (("project_id", pymongo.ASCENDING), {"background": True}),
-        (("user_id", pymongo.ASCENDING), {"background": True}),
+        IndexModel([("document_id", pymongo.ASCENDING)], background=True),
+        IndexModel([("project_id", pymongo.ASCENDING)], background=True),
+        IndexModel([("user_id", pymongo.ASCENDING)], background=True),
+        # list_sessions(project_id, sort_by="-created_at") -> sort by (created_at desc, _id asc) without in-memory sort
+        IndexModel(
+            [("project_id", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING), ("_id", pymongo.ASCENDING)],
+            background=True,
+        ),
+        # list_sessions(project_id, cursor) -> keyset pagination by _id
+        IndexModel([("project_id", pymongo.ASCENDING), ("_id", pymongo.DESCENDING)], background=True),
     ],
     Coll.TURNS: [
-        (("project_id", pymongo.ASCENDING), {"background": True}),
-        (("session_id", pymongo.ASCENDING), {"background": True}),
-        (("user_id", pymongo.ASCENDING), {"background": True}),
+        IndexModel([("project_id", pymongo.ASCENDING)], background=True),
+        IndexModel([("session_id", pymongo.ASCENDING)], background=True),
+        IndexModel([("user_id", pymongo.ASCENDING)], background=True),
+        # list_turns(session_id, sort_by="created_at") -> sort by (created_at asc, _id asc) without in-memory sort
+        IndexModel(
+            [("session_id", pymongo.ASCENDING), ("created_at", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)],
+            background=True,
+        ),
+        # list_turns(session_id, cursor) -> keyset pagination by _id
+        IndexModel([("session_id", pymongo.ASCENDING), ("_id", pymongo.DESCENDING)], background=True),
     ],
 }
 
+# max number of write operations sent to MongoDB in a single bulk write
+MIGRATION_BATCH_SIZE = 1000
+
 MODEL_VERSIONS = {
     Coll.KB: VER_KB,
     Coll.PROJECTS: VER_PROJECTS,
@@ -80,17 +99,13 @@ def prepare_db():
 
     for coll_name, indexes in INDEXES.items():
         coll = db[coll_name]
+        index_names = set(coll.index_information()) if coll_name in coll_names else set()
 
-        if coll_name in coll_names:
-            index_names = {x["key"][0][0] for x in coll.index_information().values()}
-        else:
-            index_names = set()
-
-        for index, kwargs in indexes:
-            if index[0] not in index_names:
-                logger.info("Creating index %s for coll %s", index, coll_name.value)
-                coll.create_index([index], **kwargs)
-                updated = True
+        # missing indexes of a collection are created with a single createIndexes command
+        if missing := [x for x in indexes if x.document["name"] not in index_names]:
+            logger.info("Creating indexes %s for coll %s", [x.document["name"] for x in missing], coll_name.value)
+            coll.create_indexes(missing)
+            updated = True
 
     if not updated:
         logger.info("Collections already initialized --> skipping")
@@ -103,41 +118,52 @@ def migrate_mongo_data():
     updated = False
 
     for c_name, ver in MODEL_VERSIONS.items():
-        if c_name == Coll.KB:
-            func = _migrate_kb
-        elif c_name == Coll.PROJECTS:
-            func = _migrate_project
-        elif c_name == Coll.SESSIONS:
-            func = _migrate_session
-        elif c_name == Coll.TURNS:
-            func = _migrate_turn
-        else:
+        if (func := MIGRATORS.get(c_name)) is None:
             continue
 
         coll = db[c_name]
-        old = list(coll.find({"model_version": {"$lt": ver}}))
         new = []
-
-        for d in old:
-            try:
-                new.append(func(d))
-            except Exception as e:
-                logger.warning("Failed to migrate %s in coll %s: %s", d.get("_id"), c_name.value, e)
+        migrated = 0
+
+        # stream the documents and write them in batches (memory bound by the batch size, not the collection size)
+        with coll.find(
+                {"model_version": {"$lt": ver}},
+                batch_size=MIGRATION_BATCH_SIZE,
+                no_cursor_timeout=True,
+        ) as cursor:
+            for d in cursor:
+                try:
+                    new.append(func(d))
+                except Exception as e:
+                    logger.warning("Failed to migrate %s in coll %s: %s", d.get("_id"), c_name.value, e)
+                    continue
+
+                if len(new) >= MIGRATION_BATCH_SIZE:
+                    _replace_migrated(coll, new)
+                    migrated += len(new)
+                    new.clear()
 
         if new:
-            logger.info("Migrating %d document(s) in coll %s", len(new), c_name.value)
-            operations = [ReplaceOne({"_id": d.id}, d.model_dump()) for d in new]
-            updated = True
+            _replace_migrated(coll, new)
+            migrated += len(new)
 
-            try:
-                coll.bulk_write(operations, ordered=False)
-            except Exception as e:
-                logger.error("Failed to replace migrated documents: %s", e)
+        if migrated:
+            logger.info("Migrated %d document(s) in coll %s", migrated, c_name.value)
+            updated = True
 
     if not updated:
         logger.info("No migration needed --> skipping")
 
 
+def _replace_migrated(coll: Collection, docs: list[BaseModel]):
+    """Replace documents with their migrated versions (one bulk write, each replace is atomic)."""
+
+    try:
+        coll.bulk_write([ReplaceOne({"_id": d.id}, d.model_dump()) for d in docs], ordered=False)
+    except Exception as e:
+        logger.error("Failed to replace migrated documents: %s", e)
+
+
 def _migrate_kb(old: dict[str, Any]) -> KnowledgeBase:
     """Migrate knowledge base data to the current version."""
 
@@ -174,6 +200,14 @@ def _migrate_turn(old: dict[str, Any]) -> Turn:
     return Turn.model_validate(old)
 
 
+MIGRATORS: dict[Coll, Callable[[dict[str, Any]], BaseModel]] = {
+    Coll.KB: _migrate_kb,
+    Coll.PROJECTS: _migrate_project,
+    Coll.SESSIONS: _migrate_session,
+    Coll.TURNS: _migrate_turn,
+}
+
+
 def migrate_first_user_query():
     """Migrate old sessions to include first user query."""
 
@@ -7,10 +7,12 @@
 """
 
 import cgi
+import hashlib
 import time
 from collections import deque
 from contextlib import suppress
-from typing import Generator
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Generator
 from urllib.parse import parse_qsl, urldefrag, urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 
@@ -47,6 +49,10 @@ EXT_TO_MIMETYPE_MAPPING = {
     "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
 }
 
+# Downloaded content is kept in memory up to this size, larger files are rolled over to a temporary file on disk
+STREAM_MAX_MEMORY_SIZE = 4 << 20
+STREAM_CHUNK_SIZE = 64 << 10
+
 SUPPORTED_EXT = {"htm", "html", "pdf"}
 SUPPORTED_MIMETYPES = {EXT_TO_MIMETYPE_MAPPING[ext] for ext in SUPPORTED_EXT}
 
@@ -104,6 +110,9 @@ class Scraper:
 
         self._content = None
         self._soup = None
+        self._stream = None
+        self._size = None
+        self._content_hash = None
 
         self._charset = None
         self._headers = None
@@ -141,12 +150,63 @@ class Scraper:
         if self._content is not None:
             return self._content
 
+        stream = self.stream
+        self._content = stream.read()
+        stream.seek(0)
+        return self._content
+
+    @property
+    def stream(self) -> BinaryIO:
+        """
+        Get the URL page/file content as a file-like object (rewound to the start).
+
+        The content is downloaded in chunks into a spooled temporary file, so that large files are not held in memory.
+        The stream should be closed using `close` when not needed anymore.
+        """
+
+        if self._stream is not None:
+            return self._stream
+
         if self.mimetype not in self._supported_mimetypes:
             raise exc.UnsupportedContentType(url=self.url, content_type=self.mimetype)
 
-        r = requests.get(self.url_final, headers=self._request_headers, timeout=self._request_timeout)
-        self._content = r.content
-        return self._content
+        stream = SpooledTemporaryFile(max_size=STREAM_MAX_MEMORY_SIZE)
+        content_hash = hashlib.blake2b(digest_size=16)
+        try:
+            with requests.get(
+                    self.url_final,
+                    headers=self._request_headers,
+                    timeout=self._request_timeout,
+                    stream=True,
+            ) as r:
+                for chunk in r.iter_content(STREAM_CHUNK_SIZE):
+                    stream.write(chunk)
+                    content_hash.update(chunk)
+        except Exception:
+            stream.close()
+            raise
+
+        self._size = stream.tell()
+        self._content_hash = content_hash.hexdigest()
+        stream.seek(0)
+        self._stream = stream
+        return self._stream
+
+    @property
+    def size(self) -> int | None:
+        """Get the downloaded content size (None if not downloaded yet)."""
+        return self._size
+
+    @property
+    def content_hash(self) -> str | None:
+        """Get the downloaded content hash (BLAKE2b-128 hex digest, None if not downloaded yet)."""
+        return self._content_hash
+
+    def close(self):
+        """Close the downloaded content stream."""
+
+        if self._stream is not None:
+            self._stream.close()
 
     @property
     def soup(self) -> BeautifulSoup | None:
@@ -424,7 +484,11 @@ class Crawler:
                 yield url
 
     def crawl(self) -> Generator[Scraper, None, None]:
-        """Crawl the website."""
+        """
+        Crawl the website.
+
+        The yielded scrapers hold the downloaded content stream, it is up to the caller to close them.
+        """
 
         seed_norm = self._normalize_url(self.start_url, "") or self.start_url
         q: deque[tuple[str, int]] = deque()
@@ -453,9 +517,9 @@ class Crawler:
             if url_final != url and not self._can_fetch(url_final, seen=seen):
                 continue
 
-            # Get URL content
+            # Download URL content
             try:
-                _ = scraper.content
+                _ = scraper.stream
             except Exception as e:
                 logger.error("Error occurred during crawling -> skipping URL %s: %s", url, e)
                 continue
@@ -6,14 +6,16 @@
     Utilities for the "knowledge_base" collection.
 """
 
+from threading import RLock
 from typing import Any
 
-from cachetools.func import ttl_cache
+from cachetools import TTLCache, cached
+from pymongo import UpdateOne
 from pymongo.errors import DuplicateKeyError
 
 from common.models.enums import Coll, SourceType
 from common.models.knowledge_base import KnowledgeBase
-from common.services.mongo import prepare_projection, process_filter
+from common.services.mongo import find_paginated, prepare_projection, process_filter
 from common.utils import exceptions as exc
 from kronos.services.db.mongo.connection import get_coll
 
@@ -35,10 +37,10 @@ def get_kb(kb_id: str, fields: set[str] | None = None) -> KnowledgeBase | dict[s
     return res if projection else KnowledgeBase.model_validate(res)
 
 
-@ttl_cache(ttl=300)
+@cached(cache=TTLCache(maxsize=4096, ttl=60), key=lambda kb_id: kb_id, lock=RLock())
 def get_kb_cached(kb_id: str) -> KnowledgeBase:
     """
-    Find a knowledge base entry in the DB (cached with a TTL cache).
+    Find a knowledge base entry in the DB (cached with a TTL cache, invalidated on knowledge base update/delete).
 
     :param kb_id: knowledge base ID
     :return: knowledge base data
@@ -47,6 +49,14 @@ def get_kb_cached(kb_id: str) -> KnowledgeBase:
     return get_kb(kb_id=kb_id)
 
 
+def _invalidate_cached(*kb_ids: str):
+    """Remove knowledge bases from the cache (the cache is per-process, other workers rely on the TTL)."""
+
+    with get_kb_cached.cache_lock:
+        for kb_id in kb_ids:
+            get_kb_cached.cache.pop(kb_id, None)
+
+
 def get_kb_bulk(kb_ids: list[str], fields: set[str] | None = None) -> list[KnowledgeBase | dict[str, Any]]:
     """
     Find knowledge base entries in the DB in bulk.
@@ -95,10 +105,32 @@ def update_kb(data: KnowledgeBase):
     """
 
     res = COLL_KB.update_one({"_id": data.id}, {"$set": data.model_dump(exclude_unset=True)})
+    _invalidate_cached(data.id)
     if not res.acknowledged or res.matched_count != 1:
         raise exc.DBRecordNotFound(_id=data.id) from None
 
 
+def update_kb_bulk(data: list[KnowledgeBase]):
+    """
+    Update already existing knowledge base entries in the DB in bulk (single bulk write).
+
+    :param data: list of knowledge base data
+    """
+
+    if not data:
+        return
+
+    operations = [UpdateOne({"_id": d.id}, {"$set": d.model_dump(exclude_unset=True)}) for d in data]
+    res = COLL_KB.bulk_write(operations, ordered=False)
+    _invalidate_cached(*(d.id for d in data))
+
+    if not res.acknowledged or res.matched_count != len(operations):
+        kb_ids = {d.id for d in data}
+        found = {x["_id"] for x in COLL_KB.find({"_id": {"$in": list(kb_ids)}}, {"_id": 1})}
+        if missing := kb_ids - found:
+            raise exc.DBRecordNotFound(_id=missing) from None
+
+
 def delete_kb(kb_id: str, raise_not_found: bool = False) -> int:
     """
     Delete knowledge base entry from the DB.
@@ -109,11 +141,25 @@ def delete_kb(kb_id: str, raise_not_found: bool = False) -> int:
     """
 
     res = COLL_KB.delete_one({"_id": kb_id})
+    _invalidate_cached(kb_id)
     if raise_not_found and res.deleted_count != 1:
         raise exc.DBRecordNotFound(_id=kb_id) from None
     return res.deleted_count
 
 
+def delete_kb_bulk(kb_ids: list[str]) -> int:
+    """
+    Delete knowledge base entries from the DB in bulk.
+
+    :param kb_ids: list of knowledge base IDs
+    :return: deleted count
+    """
+
+    res = COLL_KB.delete_many({"_id": {"$in": list(set(kb_ids))}})
+    _invalidate_cached(*kb_ids)
+    return res.deleted_count
+
+
 def delete_kb_for_project(project_id: str) -> int:
     """
     Delete all knowledge base entries for a project.
@@ -123,6 +169,7 @@ def delete_kb_for_project(project_id: str) -> int:
     """
 
     res = COLL_KB.delete_many({"project_id": project_id})
+    get_kb_cached.cache_clear()
     return res.deleted_count
 
 
@@ -159,15 +206,14 @@ def list_kb(
 
     ftr = process_filter(ftr)
     projection = prepare_projection(fields)
-    total = COLL_KB.count_documents(ftr)
-    res = COLL_KB.find(ftr, projection)
-
-    if sort_by:
-        sort_order = -1 if sort_by.startswith("-") else 1
-        res.sort([(sort_by.lstrip("-"), sort_order), "_id"])
-
-    if per_page > 0:
-        res = res.skip(per_page * (page_no - 1)).limit(per_page)
-
-    res = list(res) if projection else [KnowledgeBase.model_validate(x) for x in res]
+    res, total = find_paginated(
+        COLL_KB,
+        ftr=ftr,
+        projection=projection,
+        sort_by=sort_by,
+        page_no=page_no,
+        per_page=per_page,
+    )
+
+    res = res if projection else [KnowledgeBase.model_validate(x) for x in res]
     return res, total
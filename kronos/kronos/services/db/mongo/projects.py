@@ -7,14 +7,16 @@
 """
 
 import re
+from threading import RLock
 
-from cachetools.func import ttl_cache
+from cachetools import TTLCache, cached
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
 from common.models.enums import Coll
 from common.models.project import Project
 from common.models.validation import utc_now
-from common.services.mongo import prepare_projection, process_filter
+from common.services.mongo import find_paginated, prepare_projection, process_filter
 from common.utils import exceptions as exc
 from kronos.services.db.mongo.connection import get_coll
 
@@ -34,10 +36,10 @@ def get_project(project_id: str) -> Project:
     return Project.model_validate(res)
 
 
-@ttl_cache(ttl=300)
+@cached(cache=TTLCache(maxsize=1024, ttl=30), key=lambda project_id: project_id, lock=RLock())
 def get_project_cached(project_id: str) -> Project:
     """
-    Find a project in the DB (cached with a TTL cache).
+    Find a project in the DB (cached with a TTL cache, invalidated on project update/touch/delete).
 
     :param project_id: project ID
     :return: project data
@@ -46,6 +48,13 @@ def get_project_cached(project_id: str) -> Project:
     return get_project(project_id=project_id)
 
 
+def _invalidate_cached(project_id: str):
+    """Remove a project from the cache (the cache is per-process, other workers rely on the TTL)."""
+
+    with get_project_cached.cache_lock:
+        get_project_cached.cache.pop(project_id, None)
+
+
 def create_project(data: Project) -> str:
     """
     Create a new project record in the DB.
@@ -61,17 +70,24 @@ def create_project(data: Project) -> str:
         raise exc.DBRecordAlreadyExists(_id=data.id) from None
 
 
-def update_project(data: Project):
+def update_project(data: Project) -> Project:
     """
     Update an already existing project in the DB.
 
     :param data: project data
+    :return: updated project data
     """
 
     data.modified_at = utc_now()
-    res = COLL_PROJECTS.update_one({"_id": data.id}, {"$set": data.model_dump(exclude_unset=True)})
-    if not res.acknowledged or res.matched_count != 1:
+    res = COLL_PROJECTS.find_one_and_update(
+        {"_id": data.id},
+        {"$set": data.model_dump(exclude_unset=True)},
+        return_document=ReturnDocument.AFTER,
+    )
+    _invalidate_cached(data.id)
+    if res is None:
         raise exc.DBRecordNotFound(_id=data.id) from None
+    return Project.model_validate(res)
 
 
 def touch_project(project_id: str | None):
@@ -85,6 +101,7 @@ def touch_project(project_id: str | None):
         return
 
     res = COLL_PROJECTS.update_one({"_id": project_id}, {"$set": {"modified_at": utc_now()}})
+    _invalidate_cached(project_id)
     if not res.acknowledged or res.matched_count != 1:
         raise exc.DBRecordNotFound(_id=project_id) from None
 
@@ -99,6 +116,7 @@ def delete_project(project_id: str, raise_not_found: bool = False) -> int:
     """
 
     res = COLL_PROJECTS.delete_one({"_id": project_id})
+    _invalidate_cached(project_id)
     if raise_not_found and res.deleted_count != 1:
         raise exc.DBRecordNotFound(_id=project_id) from None
     return res.deleted_count
@@ -141,17 +159,16 @@ def list_projects(
         })
 
     projection = prepare_projection(fields)
-    total = COLL_PROJECTS.count_documents(ftr)
-    res = COLL_PROJECTS.find(ftr, projection)
-
-    if sort_by:
-        sort_order = -1 if sort_by.startswith("-") else 1
-        res.sort([(sort_by.lstrip("-"), sort_order), "_id"])
-
-    if per_page > 0:
-        res = res.skip(per_page * (page_no - 1)).limit(per_page)
-
-    res = list(res) if projection else [Project.model_validate(x) for x in res]
+    res, total = find_paginated(
+        COLL_PROJECTS,
+        ftr=ftr,
+        projection=projection,
+        sort_by=sort_by,
+        page_no=page_no,
+        per_page=per_page,
+    )
+
+    res = res if projection else [Project.model_validate(x) for x in res]
     return res, total
 
 
@@ -6,11 +6,12 @@
     Utilities for the "sessions" collection.
 """
 
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
 from common.models.enums import Coll
 from common.models.session import Session
-from common.services.mongo import prepare_projection, process_filter
+from common.services.mongo import find_paginated, prepare_projection, process_filter
 from common.utils import exceptions as exc
 from kronos.services.db.mongo.connection import get_coll
 
@@ -45,16 +46,22 @@ def create_session(data: Session) -> str:
         raise exc.DBRecordAlreadyExists(_id=data.id) from None
 
 
-def update_session(data: Session):
+def update_session(data: Session) -> Session:
     """
     Update an already existing session in the DB.
 
     :param data: session data
+    :return: updated session data
     """
 
-    res = COLL_SESSIONS.update_one({"_id": data.id}, {"$set": data.model_dump(exclude_unset=True)})
-    if not res.acknowledged or res.matched_count != 1:
+    res = COLL_SESSIONS.find_one_and_update(
+        {"_id": data.id},
+        {"$set": data.model_dump(exclude_unset=True)},
+        return_document=ReturnDocument.AFTER,
+    )
+    if res is None:
         raise exc.DBRecordNotFound(_id=data.id) from None
+    return Session.model_validate(res)
 
 
 def delete_session(session_id: str, raise_not_found: bool = False) -> int:
@@ -93,6 +100,7 @@ def list_sessions(
         sort_by: str | None = None,
         page_no: int = 1,
         per_page: int = 10,
+        cursor: str | None = None,
 ) -> tuple[list[Session], int]:
     """
     List all sessions with optional filters.
@@ -105,6 +113,7 @@ def list_sessions(
     :param sort_by: field name to sort by (for descending order user prefix "-")
     :param page_no: [pagination] page number
     :param per_page: [pagination] results per page (use 0 for no pagination)
+    :param cursor: [pagination] keyset pagination cursor (ID of the last item of the previous page)
     :return: list of sessions data, total count
     """
 
@@ -117,17 +126,17 @@ def list_sessions(
 
     ftr = process_filter(ftr)
     projection = prepare_projection(fields)
-    total = COLL_SESSIONS.count_documents(ftr)
-    res = COLL_SESSIONS.find(ftr, projection)
-
-    if sort_by:
-        sort_order = -1 if sort_by.startswith("-") else 1
-        res.sort([(sort_by.lstrip("-"), sort_order), "_id"])
-
-    if per_page > 0:
-        res = res.skip(per_page * (page_no - 1)).limit(per_page)
-
-    res = list(res) if projection else [Session.model_validate(x) for x in res]
+    res, total = find_paginated(
+        COLL_SESSIONS,
+        ftr=ftr,
+        projection=projection,
+        sort_by=sort_by,
+        page_no=page_no,
+        per_page=per_page,
+        cursor=cursor,
+    )
+
+    res = res if projection else [Session.model_validate(x) for x in res]
     return res, total
 
 
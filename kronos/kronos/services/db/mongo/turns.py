@@ -10,7 +10,7 @@ from pymongo.errors import DuplicateKeyError
 
 from common.models.enums import Coll
 from common.models.turn import Turn
-from common.services.mongo import prepare_projection, process_filter
+from common.services.mongo import find_paginated, prepare_projection, process_filter
 from common.utils import exceptions as exc
 from kronos.services.db.mongo.connection import get_coll
 
@@ -92,6 +92,7 @@ def list_turns(
         sort_by: str | None = None,
         page_no: int = 1,
         per_page: int = 10,
+        cursor: str | None = None,
 ) -> tuple[list[Turn], int]:
     """
     List all turns with optional filters.
@@ -103,6 +104,7 @@ def list_turns(
     :param sort_by: field name to sort by (for descending order user prefix "-")
     :param page_no: [pagination] page number
     :param per_page: [pagination] results per page (use 0 for no pagination)
+    :param cursor: [pagination] keyset pagination cursor (ID of the last item of the previous page)
     :return: list of turns data, total count
     """
 
@@ -114,15 +116,15 @@ def list_turns(
 
     ftr = process_filter(ftr)
     projection = prepare_projection(fields)
-    total = COLL_TURNS.count_documents(ftr)
-    res = COLL_TURNS.find(ftr, projection)
-
-    if sort_by:
-        sort_order = -1 if sort_by.startswith("-") else 1
-        res.sort([(sort_by.lstrip("-"), sort_order), "_id"])
-
-    if per_page > 0:
-        res = res.skip(per_page * (page_no - 1)).limit(per_page)
-
-    res = list(res) if projection else [Turn.model_validate(x) for x in res]
+    res, total = find_paginated(
+        COLL_TURNS,
+        ftr=ftr,
+        projection=projection,
+        sort_by=sort_by,
+        page_no=page_no,
+        per_page=per_page,
+        cursor=cursor,
+    )
+
+    res = res if projection else [Turn.model_validate(x) for x in res]
     return res, total
@@ -6,23 +6,34 @@
     Ragnarok service utilities.
 """
 
-from typing import BinaryIO, Generator
+from typing import AsyncGenerator, BinaryIO
 
 import httpx
 import requests
 
-from common.config import CONFIG, DF
+from common.config import CONFIG, DF, URLS
 from common.models import api as ma, api_ragnarok as mar, elastic as me
 from common.models.enums import SourceType
 from common.models.project import EmbeddingModelSettings
 
-RAGNAROK_URL = str(CONFIG.RAGNAROK_URL).rstrip("/")
+RAGNAROK_URL = URLS.RAGNAROK
 
 HEADERS = {
     "accept": "application/json",
     "Authorization": CONFIG.RAGNAROK_API_KEY.get_secret_value(),
 }
 
+# Shared keep-alive client for the async RAG requests (streamed responses hold a connection for the whole stream)
+_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+    timeout=httpx.Timeout(60, connect=5),
+)
+
+
+async def close_http_client():
+    """Close the shared HTTP client (call on app shutdown)."""
+    await _http_client.aclose()
+
 
 def upload_file_kb(
         file: BinaryIO,
@@ -109,6 +120,25 @@ def delete_kb(kb_id: str) -> ma.DeletedCount:
     return ma.DeletedCount.model_validate(res.json())
 
 
+def delete_kb_bulk(kb_ids: list[str]) -> ma.DeletedCount:
+    """
+    Delete data of multiple knowledge bases from Ragnarok.
+
+    :param kb_ids: knowledge base IDs
+    :return: deleted count
+    """
+
+    res = requests.delete(
+        url=f"{RAGNAROK_URL}/knowledge_base/bulk",
+        json=kb_ids,
+        headers=HEADERS,
+        timeout=(5, 30),
+    )
+
+    res.raise_for_status()
+    return ma.DeletedCount.model_validate(res.json())
+
+
 def delete_project(project_id: str) -> ma.DeletedCount:
     """
     Delete project data from Ragnarok.
@@ -136,39 +166,60 @@ async def query_rag(project_id: str, payload: mar.RAGPayload) -> mar.RAGResponse
     :return: RAG response dict
     """
 
-    async with httpx.AsyncClient() as client:
-        res = await client.post(
-            url=f"{RAGNAROK_URL}/projects/{project_id}/nlp/rag/",
-            json=payload.model_dump(mode="json"),
-            headers=HEADERS,
-            timeout=httpx.Timeout(60, connect=5),
-        )
+    res = await _http_client.post(
+        url=f"{RAGNAROK_URL}/projects/{project_id}/nlp/rag/",
+        json=payload.model_dump(mode="json"),
+        headers=HEADERS,
+    )
 
     res.raise_for_status()
     return mar.RAGResponse.model_validate(res.json())
 
 
-def query_rag_stream(project_id: str, payload: mar.RAGPayload) -> Generator[str, None, None]:
+async def query_rag_stream(project_id: str, payload: mar.RAGPayload) -> AsyncGenerator[bytes, None]:
     """
     Get streamed RAG response from Ragnarok.
 
+    The request is sent (and its status checked) right away, the returned async generator streams the response.
+
     :param project_id: project ID
     :param payload: RAG payload
-    :return: streamed RAG response
+    :return: streamed RAG response (raw ndjson lines)
     """
 
     headers = HEADERS.copy()
     del headers["accept"]
 
-    res = requests.post(
+    request = _http_client.build_request(
+        method="POST",
         url=f"{RAGNAROK_URL}/projects/{project_id}/nlp/rag/stream",
         json=payload.model_dump(mode="json"),
         headers=headers,
-        timeout=(5, 60),
-        stream=True,
     )
+    res = await _http_client.send(request, stream=True)
 
-    res.raise_for_status()
+    try:
+        res.raise_for_status()
+    except BaseException:
+        await res.aclose()
+        raise
+
+    return _iter_lines(res=res)
+
+
+async def _iter_lines(res: httpx.Response) -> AsyncGenerator[bytes, None]:
+    """Iterate over non-empty lines of a streamed response as bytes (the response gets closed)."""
+
+    try:
+        buffer = b""
+        async for data in res.aiter_bytes():
+            *lines, buffer = (buffer + data).split(b"\n")
+            for line in lines:
+                if line:
+                    yield line
+
+        if buffer:
+            yield buffer
 
-    for line in res.iter_lines():
-        yield line.decode()
+    finally:
+        await res.aclose()
@@ -6,6 +6,8 @@
     Azure storage implementation.
 """
 
+from typing import BinaryIO
+
 from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient
 
@@ -42,11 +44,25 @@ class AzureStorage(StorageBase):
         except ResourceNotFoundError:
             raise exc.ResourceNotFound(resource_id=file_path) from None
 
+    def exists(self, file_path: str) -> bool:
+        blob_client = self._get_blob_client(blob_name=file_path)
+
+        try:
+            blob_client.get_blob_properties()
+            return True
+        except ResourceNotFoundError:
+            return False
+
     def post_file(self, file_path: str, content: bytes):
         logger.debug("Uploading %s to container %s", file_path, self.container_name)
         blob_client = self._get_blob_client(blob_name=file_path)
         blob_client.upload_blob(content, overwrite=True)
 
+    def post_file_stream(self, file_path: str, fileobj: BinaryIO, size: int | None = None):
+        logger.debug("Uploading %s to container %s (streamed)", file_path, self.container_name)
+        blob_client = self._get_blob_client(blob_name=file_path)
+        blob_client.upload_blob(fileobj, length=size, overwrite=True)
+
     def delete_file(self, file_path: str) -> int:
         logger.debug("Deleting %s from container %s", file_path, self.container_name)
         blob_client = self._get_blob_client(blob_name=file_path)
@@ -58,9 +74,16 @@ class AzureStorage(StorageBase):
             return 0
 
     def delete_folder(self, folder_path: str) -> int:
-        folder_path = f"{folder_path.rstrip('/')}/".lstrip("/")
-        logger.debug("Deleting folder %s from container %s", folder_path, self.container_name)
-        blob_names = [x["name"] for x in self.container_client.list_blobs(name_starts_with=folder_path)]
+        return self.delete_folders([folder_path])
+
+    def delete_folders(self, folder_paths: list[str]) -> int:
+        folder_paths = [f"{x.rstrip('/')}/".lstrip("/") for x in folder_paths]
+        logger.debug("Deleting folders %s from container %s", folder_paths, self.container_name)
+        blob_names = [
+            x["name"]
+            for folder_path in folder_paths
+            for x in self.container_client.list_blobs(name_starts_with=folder_path)
+        ]
 
         for blob_names_batch in generate_batches(blob_names, self.max_batch_size):
             self.container_client.delete_blobs(*blob_names_batch)
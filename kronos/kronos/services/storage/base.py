@@ -7,6 +7,7 @@
 """
 
 from abc import ABC, abstractmethod
+from typing import BinaryIO
 
 from common.config import CONFIG
 from common.models.enums import ResourceType, SourceType
@@ -118,6 +119,17 @@ class StorageBase(ABC, metaclass=SingletonABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def exists(self, file_path: str) -> bool:
+        """
+        Check whether a file exists in the storage (metadata request only, the content is not downloaded).
+
+        :param file_path: path to the file in the storage
+        :return: True if the file exists
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def post_file(self, file_path: str, content: bytes):
         """
@@ -129,6 +141,18 @@ class StorageBase(ABC, metaclass=SingletonABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def post_file_stream(self, file_path: str, fileobj: BinaryIO, size: int | None = None):
+        """
+        Upload a file to the storage from a file object (streamed in chunks). Overwrite if it already exists.
+
+        :param file_path: file path in the storage
+        :param fileobj: readable binary file object positioned at the start of the content
+        :param size: content size in bytes (if known)
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def delete_file(self, file_path: str) -> int:
         """
@@ -151,6 +175,17 @@ class StorageBase(ABC, metaclass=SingletonABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_folders(self, folder_paths: list[str]) -> int:
+        """
+        Remove multiple folders from the storage (deleted in batches).
+
+        :param folder_paths: paths of the folders in the storage
+        :return: number of deleted files/blobs
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def list_files(self, prefix: str = f"{CONFIG.STORAGE_PREFIX}/") -> list[str]:
         """
@@ -7,6 +7,7 @@
 """
 
 from io import BytesIO
+from typing import BinaryIO
 
 from minio import Minio
 from minio.deleteobjects import DeleteObject
@@ -19,6 +20,9 @@ from kronos.services.storage.base import StorageBase
 
 logger = get_component_logger()
 
+# Multipart upload part size used for streamed uploads of unknown size
+STREAM_PART_SIZE = 10 * 1024 * 1024
+
 
 class MinioStorage(StorageBase):
 
@@ -65,11 +69,23 @@ class MinioStorage(StorageBase):
                 response.close()
                 response.release_conn()
 
+    def exists(self, file_path: str) -> bool:
+        return self._object_exists(file_path)
+
     def post_file(self, file_path: str, content: bytes):
         logger.debug("Uploading %s to bucket %s", file_path, self.bucket_name)
         client = self._get_client()
         client.put_object(self.bucket_name, file_path, BytesIO(content), len(content))
 
+    def post_file_stream(self, file_path: str, fileobj: BinaryIO, size: int | None = None):
+        logger.debug("Uploading %s to bucket %s (streamed)", file_path, self.bucket_name)
+        client = self._get_client()
+
+        if size is None:
+            client.put_object(self.bucket_name, file_path, fileobj, -1, part_size=STREAM_PART_SIZE)
+        else:
+            client.put_object(self.bucket_name, file_path, fileobj, size)
+
     def delete_file(self, file_path: str) -> int:
         logger.debug("Deleting %s from bucket %s", file_path, self.bucket_name)
         client = self._get_client()
@@ -81,15 +97,20 @@ class MinioStorage(StorageBase):
         return 1
 
     def delete_folder(self, folder_path: str) -> int:
-        folder_path = f"{folder_path.rstrip('/')}/".lstrip("/")
-        logger.debug("Deleting folder %s from bucket %s", folder_path, self.bucket_name)
+        return self.delete_folders([folder_path])
+
+    def delete_folders(self, folder_paths: list[str]) -> int:
+        folder_paths = [f"{x.rstrip('/')}/".lstrip("/") for x in folder_paths]
+        logger.debug("Deleting folders %s from bucket %s", folder_paths, self.bucket_name)
 
         client = self._get_client()
         delete_object_list = [
             DeleteObject(x.object_name)
+            for folder_path in folder_paths
             for x in client.list_objects(self.bucket_name, prefix=folder_path, recursive=True)
         ]
 
+        # the objects are removed in batches (multi-object delete requests) by the client
         for error in (errors := list(client.remove_objects(self.bucket_name, delete_object_list))):
             logger.warning("Failed to delete object from bucket %s: %s", self.bucket_name, error)
 
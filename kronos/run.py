@@ -9,17 +9,22 @@
 from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 
+import anyio.to_thread
 import uvicorn
 from dateutil import tz
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from common.api.security_jwt import close_http_client
 from common.config import CONFIG
 from common.core import get_component_logger
 from common.core.middleware import RequestContextLogMiddleware
 from common.utils.swagger import setup_descriptions
 from kronos import COMPONENT_ID, COMPONENT_NAME
+from kronos.api.knowledge_base import close_http_client as close_kb_http_client
+from kronos.api.resources import shutdown_probe_executor
 from kronos.api.router import api_router
+from kronos.services.ragnarok import close_http_client as close_ragnarok_http_client
 
 logger = get_component_logger()
 
@@ -62,8 +67,16 @@ async def lifespan(app: FastAPI):
         "Service %s (component_id: %s) started on %s with logging level %s",
         COMPONENT_NAME, COMPONENT_ID, datetime.now(tz=tz.UTC), CONFIG.KRONOS_LOG_LEVEL,
     )
+
+    # sync endpoints spend most of the time waiting on MongoDB/storage, allow more of them to run concurrently
+    anyio.to_thread.current_default_thread_limiter().total_tokens = CONFIG.KRONOS_THREADPOOL_SIZE
+
     yield
     logger.info("Service %s (component_id: %s) shutting down...", COMPONENT_NAME, COMPONENT_ID)
+    await close_http_client()
+    close_kb_http_client()
+    await close_ragnarok_http_client()
+    shutdown_probe_executor()
 
 
 fast_app = create_app()
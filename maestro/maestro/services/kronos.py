@@ -13,14 +13,14 @@ import httpx
 from fastapi import status
 from fastapi.exceptions import HTTPException
 
-from common.config import CONFIG
+from common.config import CONFIG, URLS
 from common.core import get_component_logger
 from common.models.enums import ResourceType, SourceType
 from common.models.project import Project
 
 logger = get_component_logger()
 
-KRONOS_URL = str(CONFIG.KRONOS_URL).rstrip("/")
+KRONOS_URL = URLS.KRONOS
 
 HEADERS = {
     "accept": "application/json",
@@ -10,10 +10,10 @@ from typing import Any
 
 import httpx
 
-from common.config import CONFIG
+from common.config import CONFIG, URLS
 from common.models.api_maestro import QueryPayload
 
-RAGNAROK_URL = str(CONFIG.RAGNAROK_URL).rstrip("/")
+RAGNAROK_URL = URLS.RAGNAROK
 
 HEADERS = {
     "accept": "application/json",
@@ -235,3 +235,23 @@ def delete_kb(kb_id: str, project_id: str = "") -> ma.DeletedCount:
 
     deleted, deleted_hl = VS.delete_kb(kb_id=kb_id, project_id=project_id, raise_not_found=False)
     return ma.DeletedCount(deleted_es_chunks=deleted, deleted_es_chunks_highlight=deleted_hl)
+
+
+@router.delete(
+    "/bulk",
+    response_model=ma.DeletedCount,
+    status_code=status.HTTP_200_OK,
+    summary="Delete knowledge base data from vector DB in bulk",
+)
+@error_handler
+def delete_kb_bulk(kb_ids: list[str], project_id: str = "") -> ma.DeletedCount:
+    """
+    Delete knowledge base data from vector DB in bulk.
+
+    :param kb_ids: knowledge base IDs
+    :param project_id: project ID
+    :return: deleted count
+    """
+
+    deleted, deleted_hl = VS.delete_kb_bulk(kb_ids=kb_ids, project_id=project_id)
+    return ma.DeletedCount(deleted_es_chunks=deleted, deleted_es_chunks_highlight=deleted_hl)
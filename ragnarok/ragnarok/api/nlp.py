@@ -6,7 +6,6 @@
     NLP / text processing endpoints.
 """
 
-import json
 from typing import Generator
 
 from fastapi import status
@@ -16,6 +15,7 @@ from fastapi.routing import APIRouter
 
 from common.core import get_component_logger
 from common.models import api_ragnarok as mar, elastic as me
+from common.utils import fast_json
 from common.utils.api import error_handler
 from ragnarok.rag import rag, rerank_by_answer
 from ragnarok.vector_db import VectorStore
@@ -170,7 +170,7 @@ def _streamed_rag_response(
         payload: mar.RAGPayload,
         chunks: list[me.KBEntry],
         text_gen: Generator[str, None, None] | None,
-) -> Generator[str, None, None]:
+) -> Generator[bytes, None, None]:
     """Generate ndjson chunks for the streamed RAG response."""
 
     answer = ""
@@ -180,21 +180,21 @@ def _streamed_rag_response(
     if text_gen is not None:
         for idx, text in enumerate(text_gen):
             answer += (text := text or "")
-            yield json.dumps({"chunk_index": idx, "is_last_chunk": False, "text": text}) + "\n"
+            yield fast_json.dumps({"chunk_index": idx, "is_last_chunk": False, "text": text}) + b"\n"
 
     chunks = _process_matched_chunks(chunks=chunks, answer=answer, payload=payload)
     if payload.return_highlights and chunks:
         # We are automatically building highlights only for the top chunk for performance reasons
         hls = [_build_highlight_group_for_hit(project_id=project_id, payload=payload, hit=chunks[0])]
 
-    yield json.dumps({
+    yield fast_json.dumps({
         "chunk_index": idx + 1,
         "is_last_chunk": True,
         "highlights": jsonable_encoder(hls),
         "matched_chunks": jsonable_encoder(chunks),
         "text": "",
         "text_full": answer,
-    }) + "\n"
+    }) + b"\n"
 
 
 def _build_highlight_group_for_hit(project_id: str, payload: mar.RAGPayload, hit: me.KBEntry) -> mar.RAGHighlightGroup:
@@ -672,6 +672,23 @@ class VectorStore(metaclass=Singleton):
             raise exc.DBRecordNotFound(kb_id)
         return deleted, deleted_hl
 
+    def delete_kb_bulk(self, kb_ids: list[str], project_id: str | None = None) -> tuple[int, int]:
+        """
+        Delete data of multiple knowledge bases by knowledge base IDs (single delete by query per index).
+
+        :param kb_ids: list of knowledge base IDs
+        :param project_id: project ID
+        :return: deleted counts - main index, highlights index
+        """
+
+        query = {"bool": {"filter": [{"terms": {"metadata.kb_id": list(set(kb_ids))}}]}}
+        if project_id:
+            query["bool"]["filter"].append({"term": {"metadata.project_id": project_id}})
+
+        deleted = self.es.delete_by_query(index=f"{self.index_name}_*", query=query)["deleted"]
+        deleted_hl = self.es.delete_by_query(index=f"{self.index_name_highlights}_*", query=query)["deleted"]
+        return deleted, deleted_hl
+
     def delete_project(self, project_id: str, raise_not_found: bool = False) -> tuple[int, int]:
         """
         Delete all project data.
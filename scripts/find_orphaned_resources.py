@@ -16,11 +16,11 @@ from time import sleep
 import requests
 from tqdm import tqdm
 
-from common.config import CONFIG
+from common.config import CONFIG, URLS
 from common.models.enums import Coll
 
-KRONOS_URL = str(CONFIG.KRONOS_URL).rstrip("/")
-RAGNAROK_URL = str(CONFIG.RAGNAROK_URL).rstrip("/")
+KRONOS_URL = URLS.KRONOS
+RAGNAROK_URL = URLS.RAGNAROK
 
 HEADERS_KRONOS = {"accept": "application/json", "X-Api-Key": CONFIG.KRONOS_API_KEY.get_secret_value()}
 HEADERS_RAGNAROK = {"accept": "application/json", "Authorization": CONFIG.RAGNAROK_API_KEY.get_secret_value()}